@@ -1,6 +1,10 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import engine, get_db
 
 router = APIRouter()
 
@@ -12,3 +16,13 @@ async def health_check() -> dict[str, str]:
         "status": "healthy",
         "service": "electric",
     }
+
+
+@router.get("/health/ready")
+def readiness_check(db: Session = Depends(get_db)) -> dict[str, str]:
+    """Readiness probe: round-trips to the database and reports pool usage."""
+    db.execute(text("SELECT 1"))
+    return {
+        "status": "ready",
+        "pool": engine.pool.status(),
+    }
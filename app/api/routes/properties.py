@@ -28,7 +28,7 @@ def list_properties(
     db: Session = Depends(get_db),
 ):
     """List all properties with pagination."""
-    return property_service.get_properties(db, skip=skip, limit=limit)
+    return property_service.get_properties_rows(db, skip=skip, limit=limit)
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
@@ -58,7 +58,7 @@ def get_property_meters(
     """Get all meters for a property."""
     # Verify property exists
     property_service.get_property(db, property_id)
-    return meter_service.get_meters_for_property(db, property_id)
+    return meter_service.get_meters_for_property_rows(db, property_id)
 
 
 @router.post(
@@ -29,10 +29,19 @@ class Settings(BaseSettings):
     # Database - defaults to Fly Volume path if /data exists
     DATABASE_URL: str = _get_default_database_url()
 
+    # Database connection pool, sized for FastAPI's threadpool concurrency
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
     # JWT Authentication
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # bcrypt cost factor (2^rounds iterations); stored hashes below it are upgraded on login
+    BCRYPT_ROUNDS: int = 12
+
 
 settings = Settings()
@@ -1,14 +1,43 @@
 """Database configuration and session management."""
 
+from typing import Any
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
 
 from app.core.config import settings
 
+
+def _pool_options(database_url: str) -> dict[str, Any]:
+    """Connection pool class and sizing for the configured database.
+
+    A private in-memory SQLite database exists only inside the connection that
+    opened it, so it keeps a per-thread SingletonThreadPool; a sized pool would
+    hand every new connection its own empty database. Files, servers and
+    shared-cache in-memory URIs get the sized QueuePool.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        in_memory = url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+        if in_memory and url.query.get("cache") != "shared":
+            return {"poolclass": SingletonThreadPool}
+    return {
+        "poolclass": QueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
+    pool_pre_ping=True,
+    **_pool_options(settings.DATABASE_URL),
 )
 
 # Create SessionLocal class
@@ -4,6 +4,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
@@ -24,6 +25,7 @@ from app.models import (
     user,  # noqa: F401
 )
 from app.web.routes import web_router
+from app.web.template_config import precompile_templates
 
 # Static files directory
 BASE_DIR = Path(__file__).resolve().parent
@@ -34,6 +36,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager."""
     # Startup: Create database tables
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables, so add indexes introduced since they were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    if not settings.DEBUG:
+        precompile_templates()
+    # Sync handlers each hold a pooled connection; never run more of them than the pool can serve
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
     yield
     # Shutdown: cleanup if needed
 
@@ -58,6 +70,11 @@ app.add_middleware(
 # Mount static files
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
+# Include web routes (Jinja2 frontend). Routes are matched in registration order and
+# page views are the bulk of the traffic, so they are checked before the /api routes;
+# no web path overlaps /api, so the order does not change which route wins
+app.include_router(web_router)
+
 # Include API routers
 app.include_router(health.router, prefix="/api", tags=["health"])
 app.include_router(auth.router, prefix="/api")
@@ -69,9 +86,6 @@ app.include_router(readings.router, prefix="/api")
 app.include_router(v2_readings.router, prefix="/api/v2")
 app.include_router(v2_billing.router, prefix="/api/v2")
 
-# Include web routes (Jinja2 frontend)
-app.include_router(web_router)
-
 
 if __name__ == "__main__":
     import uvicorn
@@ -43,8 +43,9 @@ class CostFormula(Base):
 
     def get_terms(self) -> dict[str, Decimal]:
         """Parse the stored JSON terms into a dict of Decimal coefficients."""
-        raw = json.loads(self.terms_json)
-        return {k: Decimal(str(v)) for k, v in raw.items()}
+        # set_terms stores strings; parse any bare JSON numbers straight to Decimal too
+        raw = json.loads(self.terms_json, parse_float=Decimal, parse_int=Decimal)
+        return {k: Decimal(v) for k, v in raw.items()}
 
     def set_terms(self, terms: dict[str, Decimal]) -> None:
         """Serialize a terms dict to JSON for storage."""
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -45,3 +45,15 @@ class MeterReading(Base):
     # Relationships
     meter: Mapped["Meter"] = relationship(back_populates="readings")
     recorded_by: Mapped["User | None"] = relationship()
+
+    __table_args__ = (
+        # Covers boundary and latest-reading lookups by meter and timestamp; value is
+        # a trailing key column (SQLite has no INCLUDE) so they never touch the table.
+        Index(
+            "ix_meter_readings_meter_ts_type",
+            "meter_id",
+            reading_timestamp.desc(),
+            "reading_type",
+            "value",
+        ),
+    )
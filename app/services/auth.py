@@ -5,6 +5,7 @@ from datetime import UTC, datetime, timedelta
 import bcrypt
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -19,11 +20,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 
+def password_hash_needs_update(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a lower cost than BCRYPT_ROUNDS."""
+    # bcrypt hashes look like $2b$<rounds>$<salt+hash>
+    return int(hashed_password.split("$")[2]) < settings.BCRYPT_ROUNDS
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -43,6 +50,10 @@ def authenticate_user(db: Session, username: str, password: str) -> User | None:
         return None
     if not verify_password(password, user.hashed_password):
         return None
+    # The plain password is only available here, so upgrade weaker hashes on login
+    if password_hash_needs_update(user.hashed_password):
+        user.hashed_password = get_password_hash(password)
+        db.commit()
     return user
 
 
@@ -56,17 +67,24 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
 
 
+def get_users_by_username_or_email(db: Session, username: str, email: str) -> list[User]:
+    """Get users matching either the username or the email in a single query."""
+    return db.query(User).filter(or_(User.username == username, User.email == email)).all()
+
+
 def create_user(db: Session, user: UserCreate) -> User:
     """Create a new user."""
+    existing = get_users_by_username_or_email(db, user.username, user.email)
+
     # Check if username already exists
-    if get_user_by_username(db, user.username):
+    if any(u.username == user.username for u in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
 
     # Check if email already exists
-    if get_user_by_email(db, user.email):
+    if any(u.email == user.email for u in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
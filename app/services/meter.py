@@ -1,12 +1,30 @@
 """Meter service for business logic."""
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping, event, select
+from sqlalchemy.orm import Session, UOWTransaction, raiseload
 
 from app.models.enums import MeterType, SubMeterKind
 from app.models.meter import Meter
+from app.models.property import Property
 from app.schemas.meter import MainMeterCreate, MeterUpdate, SubMeterCreate
 
+# Session.info key for the per-session {property_id: [Meter, ...]} cache. Sessions are
+# request-scoped (see get_db), so the cache never outlives a request.
+_METERS_CACHE_KEY = "meters_by_property"
+
+
+def _meters_cache(db: Session) -> dict[int, list[Meter]]:
+    """Get the session's meters-by-property cache."""
+    return db.info.setdefault(_METERS_CACHE_KEY, {})
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_meters_cache(session: Session, flush_context: UOWTransaction) -> None:
+    """Drop cached meter lists once meters are added or deleted."""
+    if any(isinstance(obj, Meter) for obj in (*session.new, *session.deleted)):
+        session.info.pop(_METERS_CACHE_KEY, None)
+
 
 def create_main_meter(db: Session, meter_data: MainMeterCreate) -> Meter:
     """Create a main meter for a property."""
@@ -76,33 +94,103 @@ def get_meter(db: Session, meter_id: int) -> Meter:
     return meter
 
 
+def get_meter_with_property(db: Session, meter_id: int) -> tuple[Meter, Property]:
+    """Get a meter and the property it belongs to in one query."""
+    row = db.execute(
+        select(Meter, Property)
+        .join(Property, Meter.property_id == Property.id)
+        .where(Meter.id == meter_id)
+    ).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meter not found",
+        )
+    return row.Meter, row.Property
+
+
 def get_meters_for_property(db: Session, property_id: int) -> list[Meter]:
-    """Get all meters for a property."""
-    return db.query(Meter).filter(Meter.property_id == property_id).all()
+    """Get all meters for a property.
+
+    Cached on the session, so repeated lookups within a request query once.
+    Relationships raise instead of lazy loading; callers that need readings or the
+    parent property must load them explicitly (e.g. with selectinload).
+    """
+    cache = _meters_cache(db)
+    if property_id not in cache:
+        cache[property_id] = (
+            db.query(Meter).options(raiseload("*")).filter(Meter.property_id == property_id).all()
+        )
+    return list(cache[property_id])
+
+
+def get_meters_for_properties(db: Session, property_ids: list[int]) -> dict[int, list[Meter]]:
+    """Get all meters for several properties in one query, grouped by property id."""
+    cache = _meters_cache(db)
+    missing_ids = [property_id for property_id in property_ids if property_id not in cache]
+    if missing_ids:
+        for property_id in missing_ids:
+            cache[property_id] = []
+        meters = (
+            db.query(Meter)
+            .options(raiseload("*"))
+            .filter(Meter.property_id.in_(missing_ids))
+            .order_by(Meter.id)
+            .all()
+        )
+        for meter in meters:
+            cache[meter.property_id].append(meter)
+    return {property_id: list(cache[property_id]) for property_id in property_ids}
+
+
+def get_meters_for_property_rows(db: Session, property_id: int) -> list[RowMapping]:
+    """Get meter columns for a property as plain mappings, skipping ORM object construction.
+
+    Intended for read-only list endpoints that serialize straight to JSON.
+    """
+    stmt = select(
+        Meter.id,
+        Meter.property_id,
+        Meter.meter_type,
+        Meter.sub_meter_kind,
+        Meter.name,
+        Meter.location,
+        Meter.created_at,
+        Meter.is_active,
+    ).where(Meter.property_id == property_id)
+    return list(db.execute(stmt).mappings().all())
 
 
 def get_main_meter_for_property(db: Session, property_id: int) -> Meter | None:
     """Get the main meter for a property."""
-    return (
-        db.query(Meter)
-        .filter(
-            Meter.property_id == property_id,
-            Meter.meter_type == MeterType.MAIN_METER,
-        )
-        .first()
+    return next(
+        (
+            m
+            for m in get_meters_for_property(db, property_id)
+            if m.meter_type == MeterType.MAIN_METER
+        ),
+        None,
     )
 
 
 def get_submeters_for_property(db: Session, property_id: int) -> list[Meter]:
     """Get all submeters for a property."""
-    return (
-        db.query(Meter)
-        .filter(
-            Meter.property_id == property_id,
-            Meter.meter_type == MeterType.SUB_METER,
-        )
-        .all()
-    )
+    return [
+        m for m in get_meters_for_property(db, property_id) if m.meter_type == MeterType.SUB_METER
+    ]
+
+
+def get_meters_split(db: Session, property_id: int) -> tuple[Meter | None, list[Meter]]:
+    """Get a property's main meter and submeters from a single meters lookup."""
+    main_meter = None
+    submeters: list[Meter] = []
+    for meter in get_meters_for_property(db, property_id):
+        if meter.meter_type == MeterType.MAIN_METER:
+            if main_meter is None:
+                main_meter = meter
+        elif meter.meter_type == MeterType.SUB_METER:
+            submeters.append(meter)
+    return main_meter, submeters
 
 
 def get_submeter_by_name(
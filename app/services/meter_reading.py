@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_
+from sqlalchemy import bindparam, func, insert, select
 from sqlalchemy.orm import Session
 
 from app.models.enums import MeterType
@@ -21,10 +21,18 @@ from app.schemas.meter_reading import (
     SubMeterReading,
 )
 from app.services.meter import (
-    get_main_meter_for_property,
     get_meters_for_property,
-    get_submeter_by_name,
-    get_submeters_for_property,
+    get_meters_split,
+)
+
+# Hot per-meter lookup, built once at import and executed with bound parameters
+_READING_VALUE_AT_TIMESTAMP = (
+    select(MeterReading.value)
+    .where(
+        MeterReading.meter_id == bindparam("meter_id"),
+        MeterReading.reading_timestamp == bindparam("reading_timestamp"),
+    )
+    .limit(1)
 )
 
 
@@ -63,15 +71,20 @@ def create_reading(
             detail="Meter not found",
         )
 
-    db_reading = MeterReading(
-        meter_id=reading_data.meter_id,
-        reading_timestamp=reading_data.reading_timestamp,
-        value=reading_data.value,
-        recorded_by_user_id=user_id,
-    )
-    db.add(db_reading)
+    # RETURNING hands back the inserted row, so no refresh SELECT is needed
+    db_reading = db.execute(
+        insert(MeterReading)
+        .values(
+            meter_id=reading_data.meter_id,
+            reading_timestamp=reading_data.reading_timestamp,
+            value=reading_data.value,
+            recorded_by_user_id=user_id,
+        )
+        .returning(MeterReading)
+    ).scalar_one()
+    # Detach before committing so the returned values are not expired and reloaded
+    db.expunge(db_reading)
     db.commit()
-    db.refresh(db_reading)
     return db_reading
 
 
@@ -81,48 +94,53 @@ def create_bulk_readings(
     user_id: int | None = None,
 ) -> list[MeterReading]:
     """Create multiple readings for a property at once."""
-    created_readings: list[MeterReading] = []
+    # Resolve every meter for the property in one query instead of one per submeter
+    meters = get_meters_for_property(db, bulk_data.property_id)
+    main_meter = next((m for m in meters if m.meter_type == MeterType.MAIN_METER), None)
+    submeters_by_name = {m.name: m for m in meters if m.name is not None}
 
-    # Get main meter and record its reading
-    main_meter = get_main_meter_for_property(db, bulk_data.property_id)
+    # Record the main meter reading
     if not main_meter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Main meter not found for property {bulk_data.property_id}",
         )
 
-    main_reading = MeterReading(
-        meter_id=main_meter.id,
-        reading_timestamp=bulk_data.reading_timestamp,
-        value=bulk_data.main_meter_value,
-        recorded_by_user_id=user_id,
-    )
-    db.add(main_reading)
-    created_readings.append(main_reading)
+    rows: list[dict] = [
+        {
+            "meter_id": main_meter.id,
+            "reading_timestamp": bulk_data.reading_timestamp,
+            "value": bulk_data.main_meter_value,
+            "recorded_by_user_id": user_id,
+        }
+    ]
 
     # Record submeter readings
     for name, value in bulk_data.submeter_readings.items():
-        submeter = get_submeter_by_name(db, bulk_data.property_id, name)
+        submeter = submeters_by_name.get(name)
         if not submeter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Submeter '{name}' not found for property {bulk_data.property_id}",
             )
 
-        reading = MeterReading(
-            meter_id=submeter.id,
-            reading_timestamp=bulk_data.reading_timestamp,
-            value=value,
-            recorded_by_user_id=user_id,
+        rows.append(
+            {
+                "meter_id": submeter.id,
+                "reading_timestamp": bulk_data.reading_timestamp,
+                "value": value,
+                "recorded_by_user_id": user_id,
+            }
         )
-        db.add(reading)
-        created_readings.append(reading)
 
+    # One multi-row INSERT for the whole batch instead of one statement per reading
+    readings = sorted(
+        db.scalars(insert(MeterReading).returning(MeterReading), rows), key=lambda r: r.id
+    )
+    for reading in readings:
+        db.expunge(reading)
     db.commit()
-    for r in created_readings:
-        db.refresh(r)
-
-    return created_readings
+    return readings
 
 
 def get_reading_value_at_timestamp(
@@ -131,17 +149,10 @@ def get_reading_value_at_timestamp(
     reading_timestamp: datetime,
 ) -> Decimal | None:
     """Get a meter reading value at a specific timestamp."""
-    reading = (
-        db.query(MeterReading)
-        .filter(
-            and_(
-                MeterReading.meter_id == meter_id,
-                MeterReading.reading_timestamp == reading_timestamp,
-            )
-        )
-        .first()
+    return db.scalar(
+        _READING_VALUE_AT_TIMESTAMP,
+        {"meter_id": meter_id, "reading_timestamp": reading_timestamp},
     )
-    return reading.value if reading else None
 
 
 def get_property_reading_summary(
@@ -222,15 +233,27 @@ def get_readings_history(
     limit: int = 100,
     offset: int = 0,
 ) -> tuple[list[MeterReading], int]:
-    """Get reading history for a specific meter with pagination."""
-    query = db.query(MeterReading).filter(MeterReading.meter_id == meter_id)
+    """Get reading history for a specific meter with pagination.
 
-    total = query.count()
-    readings = (
-        query.order_by(MeterReading.reading_timestamp.desc()).offset(offset).limit(limit).all()
+    A short page already tells the total, so the count query only runs for a full
+    page or a page past the end. It is kept separate from the page query: a
+    COUNT(*) OVER () there would read and sort every reading of the meter.
+    """
+    readings = list(
+        db.scalars(
+            select(MeterReading)
+            .where(MeterReading.meter_id == meter_id)
+            .order_by(MeterReading.reading_timestamp.desc())
+            .offset(offset)
+            .limit(limit)
+        )
     )
-
-    return readings, total
+    if len(readings) < limit and (readings or offset == 0):
+        return readings, offset + len(readings)
+    total = db.scalar(
+        select(func.count()).select_from(MeterReading).where(MeterReading.meter_id == meter_id)
+    )
+    return readings, total or 0
 
 
 def get_property_consumption(
@@ -244,8 +267,9 @@ def get_property_consumption(
 
     Consumption is calculated as: end_reading - start_reading for each meter.
     """
-    # Get main meter
-    main_meter = get_main_meter_for_property(db, property_id)
+    main_meter, submeters = get_meters_split(db, property_id)
+
+    # Main meter consumption
     main_consumption: Decimal | None = None
 
     if main_meter:
@@ -254,8 +278,7 @@ def get_property_consumption(
         if start_value is not None and end_value is not None:
             main_consumption = end_value - start_value
 
-    # Get submeter consumptions
-    submeters = get_submeters_for_property(db, property_id)
+    # Submeter consumptions
     submeter_consumptions: list[SubMeterConsumption] = []
     total_submetered = Decimal("0")
 
@@ -1,8 +1,10 @@
 """Property service for business logic."""
 
 from fastapi import HTTPException, status
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
+from app.models.associations import user_property_association
 from app.models.enums import MeterType
 from app.models.meter import Meter
 from app.models.property import Property
@@ -10,22 +12,30 @@ from app.models.user import User
 from app.schemas.property import PropertyCreate, PropertyUpdate
 
 
-def create_property(db: Session, property_data: PropertyCreate) -> Property:
-    """Create a new property with its main meter."""
+def create_property(
+    db: Session,
+    property_data: PropertyCreate,
+    *,
+    commit: bool = True,
+) -> Property:
+    """Create a new property with its main meter.
+
+    With commit=False the rows are only flushed, so callers can commit them
+    together with related writes in one transaction.
+    """
     db_property = Property(
         display_name=property_data.display_name,
         address=property_data.address,
     )
-    db.add(db_property)
-    db.flush()  # Get property.id
 
-    # Auto-create main meter for the property
-    main_meter = Meter(
-        property_id=db_property.id,
-        meter_type=MeterType.MAIN_METER,
-    )
-    db.add(main_meter)
+    # Auto-create main meter for the property; attaching it through the relationship
+    # keeps db_property.meters populated without a query
+    Meter(parent_property=db_property, meter_type=MeterType.MAIN_METER)
+    db.add(db_property)
+    db.flush()  # Assigns both ids without reading the rows back
 
+    if not commit:
+        return db_property
     db.commit()
     db.refresh(db_property)
     return db_property
@@ -47,6 +57,25 @@ def get_properties(db: Session, skip: int = 0, limit: int = 100) -> list[Propert
     return db.query(Property).offset(skip).limit(limit).all()
 
 
+def get_properties_rows(db: Session, skip: int = 0, limit: int = 100) -> list[RowMapping]:
+    """Get property columns as plain mappings, skipping ORM object construction.
+
+    Intended for read-only list endpoints that serialize straight to JSON.
+    """
+    stmt = (
+        select(
+            Property.id,
+            Property.display_name,
+            Property.address,
+            Property.created_at,
+            Property.is_active,
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(db.execute(stmt).mappings().all())
+
+
 def update_property(
     db: Session,
     property_id: int,
@@ -65,8 +94,12 @@ def update_property(
 
 
 def get_properties_for_user(db: Session, user_id: int) -> list[Property]:
-    """Get all properties associated with a user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    """Get all properties associated with a user.
+
+    The user comes from the session's identity map when already loaded, and the
+    loaded collection stays on it, so repeat calls within a request do not query.
+    """
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,14 +108,27 @@ def get_properties_for_user(db: Session, user_id: int) -> list[Property]:
     return list(user.properties)
 
 
+def get_first_property_for_user(db: Session, user_id: int) -> Property | None:
+    """Get one property associated with a user, without loading the user."""
+    return (
+        db.query(Property)
+        .join(user_property_association, user_property_association.c.property_id == Property.id)
+        .filter(user_property_association.c.user_id == user_id)
+        .first()
+    )
+
+
 def associate_user_with_property(
     db: Session,
     user_id: int,
     property_id: int,
+    *,
+    commit: bool = True,
 ) -> None:
-    """Associate a user with a property."""
-    user = db.query(User).filter(User.id == user_id).first()
-    db_property = db.query(Property).filter(Property.id == property_id).first()
+    """Associate a user with a property; commit=False leaves committing to the caller."""
+    # Session.get answers from the identity map when the caller already loaded these
+    user = db.get(User, user_id)
+    db_property = db.get(Property, property_id)
 
     if not user:
         raise HTTPException(
@@ -97,7 +143,8 @@ def associate_user_with_property(
 
     if db_property not in user.properties:
         user.properties.append(db_property)
-        db.commit()
+        if commit:
+            db.commit()
 
 
 def disassociate_user_from_property(
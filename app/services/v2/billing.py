@@ -134,6 +134,57 @@ def formula_to_response(formula: CostFormula) -> CostFormulaResponse:
     )
 
 
+def _decimal_places(value: Decimal) -> int:
+    """Number of fractional digits needed to represent a Decimal exactly."""
+    exponent = value.as_tuple().exponent
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def _to_scaled_int(value: Decimal, places: int) -> int:
+    """Convert a Decimal to an int in units of 10**-places."""
+    return int(value.scaleb(places))
+
+
+def _weighted_consumption_scaled(
+    terms: dict[str, Decimal],
+    consumptions: dict[str, Decimal],
+) -> tuple[int, int]:
+    """Compute sum(coeff * consumption[meter]) with int arithmetic.
+
+    Returns (weighted, places) where the exact result is weighted * 10**-places.
+    """
+    pairs = [(coeff, consumptions.get(name, Decimal("0"))) for name, coeff in terms.items()]
+    coeff_places = max((_decimal_places(c) for c, _ in pairs), default=0)
+    cons_places = max((_decimal_places(k) for _, k in pairs), default=0)
+    weighted = sum(
+        _to_scaled_int(c, coeff_places) * _to_scaled_int(k, cons_places) for c, k in pairs
+    )
+    return weighted, coeff_places + cons_places
+
+
+def _cost_from_scaled(
+    weighted: int,
+    weighted_places: int,
+    total_cost: Decimal,
+    main_consumption: Decimal,
+) -> Decimal:
+    """Compute total_cost * weighted / main_consumption in cents, rounding half-even.
+
+    All scale factors are folded into one integer division, so the only Decimal
+    constructed is the final two-place result.
+    """
+    total_places = _decimal_places(total_cost)
+    main_places = _decimal_places(main_consumption)
+    numerator = _to_scaled_int(total_cost, total_places) * weighted * 100 * 10**main_places
+    denominator = _to_scaled_int(main_consumption, main_places) * 10 ** (
+        total_places + weighted_places
+    )
+    cents, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and cents % 2):
+        cents += 1
+    return Decimal(cents).scaleb(-2)
+
+
 def evaluate_formula(
     terms: dict[str, Decimal],
     consumptions: dict[str, Decimal],
@@ -144,12 +195,10 @@ def evaluate_formula(
 
     Formula: cost = total_cost * sum(coeff * consumption[meter]) / main_consumption
     """
-    weighted = sum(
-        coeff * consumptions.get(meter_name, Decimal("0")) for meter_name, coeff in terms.items()
-    )
     if main_consumption <= 0:
         return Decimal("0")
-    return (total_cost * weighted / main_consumption).quantize(Decimal("0.01"))
+    weighted, places = _weighted_consumption_scaled(terms, consumptions)
+    return _cost_from_scaled(weighted, places, total_cost, main_consumption)
 
 
 def distribute_costs(
@@ -184,20 +233,14 @@ def distribute_costs(
     shares: list[FormulaShareResult] = []
     for formula in formulas:
         terms = formula.get_terms()
-        weighted = sum(
-            (
-                coeff * consumptions.get(meter_name, Decimal("0"))
-                for meter_name, coeff in terms.items()
-            ),
-            Decimal("0"),
-        )
-        cost = evaluate_formula(terms, consumptions, total_cost, main_consumption)
+        weighted, places = _weighted_consumption_scaled(terms, consumptions)
+        cost = _cost_from_scaled(weighted, places, total_cost, main_consumption)
         shares.append(
             FormulaShareResult(
                 formula_id=formula.id,
                 name=formula.name,
                 terms=terms,
-                weighted_consumption=weighted,
+                weighted_consumption=Decimal(weighted).scaleb(-places),
                 cost=cost,
             )
         )
@@ -4,9 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, case, func, insert, or_, select
 from sqlalchemy.orm import Session
 
+from app.models.associations import user_property_association
 from app.models.enums import MeterType, ReadingType
 from app.models.meter import Meter
 from app.models.meter_reading import MeterReading
@@ -19,10 +20,18 @@ from app.schemas.v2.readings import (
     SubMeterReadingV2,
 )
 from app.services.meter import (
-    get_main_meter_for_property,
     get_meters_for_property,
-    get_submeter_by_name,
-    get_submeters_for_property,
+    get_meters_split,
+)
+
+# Hot per-meter lookup, built once at import and executed with bound parameters
+_READING_VALUE_AT_TIMESTAMP = (
+    select(MeterReading.value)
+    .where(
+        MeterReading.meter_id == bindparam("meter_id"),
+        MeterReading.reading_timestamp == bindparam("reading_timestamp"),
+    )
+    .limit(1)
 )
 
 
@@ -39,16 +48,21 @@ def create_reading(
             detail="Meter not found",
         )
 
-    db_reading = MeterReading(
-        meter_id=reading_data.meter_id,
-        reading_timestamp=reading_data.reading_timestamp,
-        value=reading_data.value,
-        reading_type=reading_data.reading_type,
-        recorded_by_user_id=user_id,
-    )
-    db.add(db_reading)
+    # RETURNING hands back the inserted row, so no refresh SELECT is needed
+    db_reading = db.execute(
+        insert(MeterReading)
+        .values(
+            meter_id=reading_data.meter_id,
+            reading_timestamp=reading_data.reading_timestamp,
+            value=reading_data.value,
+            reading_type=reading_data.reading_type,
+            recorded_by_user_id=user_id,
+        )
+        .returning(MeterReading)
+    ).scalar_one()
+    # Detach before committing so the returned values are not expired and reloaded
+    db.expunge(db_reading)
     db.commit()
-    db.refresh(db_reading)
     return db_reading
 
 
@@ -58,48 +72,53 @@ def create_bulk_readings(
     user_id: int | None = None,
 ) -> list[MeterReading]:
     """Create multiple readings for a property at once."""
-    created_readings: list[MeterReading] = []
+    # Resolve every meter for the property in one query instead of one per submeter
+    meters = get_meters_for_property(db, bulk_data.property_id)
+    main_meter = next((m for m in meters if m.meter_type == MeterType.MAIN_METER), None)
+    submeters_by_name = {m.name: m for m in meters if m.name is not None}
 
-    main_meter = get_main_meter_for_property(db, bulk_data.property_id)
     if not main_meter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Main meter not found for property {bulk_data.property_id}",
         )
 
-    main_reading = MeterReading(
-        meter_id=main_meter.id,
-        reading_timestamp=bulk_data.reading_timestamp,
-        value=bulk_data.main_meter_value,
-        reading_type=bulk_data.reading_type,
-        recorded_by_user_id=user_id,
-    )
-    db.add(main_reading)
-    created_readings.append(main_reading)
+    rows: list[dict] = [
+        {
+            "meter_id": main_meter.id,
+            "reading_timestamp": bulk_data.reading_timestamp,
+            "value": bulk_data.main_meter_value,
+            "reading_type": bulk_data.reading_type,
+            "recorded_by_user_id": user_id,
+        }
+    ]
 
     for name, value in bulk_data.submeter_readings.items():
-        submeter = get_submeter_by_name(db, bulk_data.property_id, name)
+        submeter = submeters_by_name.get(name)
         if not submeter:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Submeter '{name}' not found for property {bulk_data.property_id}",
             )
 
-        reading = MeterReading(
-            meter_id=submeter.id,
-            reading_timestamp=bulk_data.reading_timestamp,
-            value=value,
-            reading_type=bulk_data.reading_type,
-            recorded_by_user_id=user_id,
+        rows.append(
+            {
+                "meter_id": submeter.id,
+                "reading_timestamp": bulk_data.reading_timestamp,
+                "value": value,
+                "reading_type": bulk_data.reading_type,
+                "recorded_by_user_id": user_id,
+            }
         )
-        db.add(reading)
-        created_readings.append(reading)
 
+    # One multi-row INSERT for the whole batch instead of one statement per reading
+    readings = sorted(
+        db.scalars(insert(MeterReading).returning(MeterReading), rows), key=lambda r: r.id
+    )
+    for reading in readings:
+        db.expunge(reading)
     db.commit()
-    for r in created_readings:
-        db.refresh(r)
-
-    return created_readings
+    return readings
 
 
 def get_reading_value_at_timestamp(
@@ -108,17 +127,10 @@ def get_reading_value_at_timestamp(
     reading_timestamp: datetime,
 ) -> Decimal | None:
     """Get a meter reading value at a specific timestamp."""
-    reading = (
-        db.query(MeterReading)
-        .filter(
-            and_(
-                MeterReading.meter_id == meter_id,
-                MeterReading.reading_timestamp == reading_timestamp,
-            )
-        )
-        .first()
+    return db.scalar(
+        _READING_VALUE_AT_TIMESTAMP,
+        {"meter_id": meter_id, "reading_timestamp": reading_timestamp},
     )
-    return reading.value if reading else None
 
 
 def get_property_reading_summary(
@@ -129,20 +141,103 @@ def get_property_reading_summary(
     """Get a complete reading summary for a property at a specific timestamp."""
     meters = get_meters_for_property(db, property_id)
 
+    values_by_meter_id: dict[int, Decimal] = {}
+    if meters:
+        rows = db.execute(
+            select(MeterReading.meter_id, MeterReading.value).where(
+                MeterReading.meter_id.in_([m.id for m in meters]),
+                MeterReading.reading_timestamp == reading_timestamp,
+            )
+        ).all()
+        for meter_id, value in rows:
+            values_by_meter_id.setdefault(meter_id, value)
+
+    return _build_reading_summary(property_id, reading_timestamp, meters, values_by_meter_id)
+
+
+def get_latest_readings_for_property(
+    db: Session,
+    property_id: int,
+) -> PropertyReadingSummaryV2 | None:
+    """Get the most recent readings for a property."""
+    meters = get_meters_for_property(db, property_id)
+    return get_latest_readings_for_properties(db, {property_id: meters})[property_id]
+
+
+def get_latest_readings_for_properties(
+    db: Session,
+    meters_by_property: dict[int, list[Meter]],
+) -> dict[int, PropertyReadingSummaryV2 | None]:
+    """Get the most recent readings for several properties in a single query.
+
+    Takes the meters already loaded per property (see get_meters_for_properties).
+    Properties without any readings map to None.
+    """
+    summaries: dict[int, PropertyReadingSummaryV2 | None] = dict.fromkeys(meters_by_property)
+    property_by_meter_id = {
+        meter.id: property_id
+        for property_id, meters in meters_by_property.items()
+        for meter in meters
+    }
+    if not property_by_meter_id:
+        return summaries
+
+    # Each property's latest timestamp, joined back to the readings taken at it
+    latest = (
+        select(Meter.property_id, func.max(MeterReading.reading_timestamp).label("latest"))
+        .join(Meter, Meter.id == MeterReading.meter_id)
+        .where(MeterReading.meter_id.in_(property_by_meter_id))
+        .group_by(Meter.property_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(latest.c.property_id, latest.c.latest, MeterReading.meter_id, MeterReading.value)
+        .join(Meter, Meter.id == MeterReading.meter_id)
+        .join(
+            latest,
+            and_(
+                latest.c.property_id == Meter.property_id,
+                latest.c.latest == MeterReading.reading_timestamp,
+            ),
+        )
+        .where(MeterReading.meter_id.in_(property_by_meter_id))
+    ).all()
+
+    latest_by_property: dict[int, datetime] = {}
+    values_by_property: dict[int, dict[int, Decimal]] = {}
+    for property_id, reading_timestamp, meter_id, value in rows:
+        latest_by_property[property_id] = reading_timestamp
+        values_by_property.setdefault(property_id, {}).setdefault(meter_id, value)
+
+    for property_id, reading_timestamp in latest_by_property.items():
+        summaries[property_id] = _build_reading_summary(
+            property_id,
+            reading_timestamp,
+            meters_by_property[property_id],
+            values_by_property[property_id],
+        )
+    return summaries
+
+
+def _build_reading_summary(
+    property_id: int,
+    reading_timestamp: datetime,
+    meters: list[Meter],
+    values_by_meter_id: dict[int, Decimal],
+) -> PropertyReadingSummaryV2:
+    """Assemble a reading summary from preloaded meters and their values at a timestamp."""
     main_meter = next(
         (m for m in meters if m.meter_type == MeterType.MAIN_METER),
         None,
     )
-    main_value = (
-        get_reading_value_at_timestamp(db, main_meter.id, reading_timestamp) if main_meter else None
-    )
+    main_value = values_by_meter_id.get(main_meter.id) if main_meter else None
 
     submeters = [m for m in meters if m.meter_type == MeterType.SUB_METER]
     submeter_readings: list[SubMeterReadingV2] = []
     submeter_values: list[Decimal] = []
 
     for submeter in submeters:
-        value = get_reading_value_at_timestamp(db, submeter.id, reading_timestamp)
+        value = values_by_meter_id.get(submeter.id)
         if value is not None:
             submeter_values.append(value)
             submeter_readings.append(
@@ -165,28 +260,38 @@ def get_property_reading_summary(
     )
 
 
-def get_latest_readings_for_property(
+def get_property_activity_counts(
     db: Session,
-    property_id: int,
-) -> PropertyReadingSummaryV2 | None:
-    """Get the most recent readings for a property."""
-    meters = get_meters_for_property(db, property_id)
-    meter_ids = [m.id for m in meters]
-
-    if not meter_ids:
-        return None
-
-    latest_reading = (
-        db.query(MeterReading)
-        .filter(MeterReading.meter_id.in_(meter_ids))
-        .order_by(MeterReading.reading_timestamp.desc())
-        .first()
-    )
-
-    if not latest_reading:
-        return None
-
-    return get_property_reading_summary(db, property_id, latest_reading.reading_timestamp)
+    user_id: int,
+    since: datetime,
+) -> dict[int, tuple[int, int]]:
+    """Count meters and readings taken since a timestamp for each of a user's properties.
+
+    One grouped query joined through the user's property associations, so no
+    id lists are bound as parameters. Returns {property_id: (meters_count,
+    readings_count)}; properties without meters are omitted.
+    """
+    rows = db.execute(
+        select(
+            Meter.property_id,
+            func.count(func.distinct(Meter.id)),
+            func.count(MeterReading.id),
+        )
+        .join(
+            user_property_association,
+            user_property_association.c.property_id == Meter.property_id,
+        )
+        .outerjoin(
+            MeterReading,
+            and_(MeterReading.meter_id == Meter.id, MeterReading.reading_timestamp >= since),
+        )
+        .where(user_property_association.c.user_id == user_id)
+        .group_by(Meter.property_id)
+    ).all()
+    return {
+        property_id: (meters_count, readings_count)
+        for property_id, meters_count, readings_count in rows
+    }
 
 
 def get_readings_history(
@@ -195,72 +300,183 @@ def get_readings_history(
     limit: int = 100,
     offset: int = 0,
 ) -> tuple[list[MeterReading], int]:
-    """Get reading history for a specific meter with pagination."""
-    query = db.query(MeterReading).filter(MeterReading.meter_id == meter_id)
-    total = query.count()
-    readings = (
-        query.order_by(MeterReading.reading_timestamp.desc()).offset(offset).limit(limit).all()
+    """Get reading history for a specific meter with pagination.
+
+    A short page already tells the total, so the count query only runs for a full
+    page or a page past the end. It is kept separate from the page query: a
+    COUNT(*) OVER () there would read and sort every reading of the meter.
+    """
+    readings = list(
+        db.scalars(
+            select(MeterReading)
+            .where(MeterReading.meter_id == meter_id)
+            .order_by(MeterReading.reading_timestamp.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+    )
+    if len(readings) < limit and (readings or offset == 0):
+        return readings, offset + len(readings)
+    total = db.scalar(
+        select(func.count()).select_from(MeterReading).where(MeterReading.meter_id == meter_id)
     )
-    return readings, total
+    return readings, total or 0
 
 
-def compute_meter_consumption(
+def get_recent_readings(
     db: Session,
-    meter_id: int,
-    start_timestamp: datetime,
-    end_timestamp: datetime,
-) -> Decimal | None:
-    """Compute consumption for a single meter over a period.
+    meter_ids: list[int],
+    limit: int = 50,
+    per_meter: int = 10,
+) -> list[MeterReading]:
+    """Get the newest readings across several meters in one query.
 
-    Supports both absolute and relative reading types:
-    - Absolute: consumption = end_reading - start_reading
-    - Relative: consumption = sum of all relative readings in the period
+    Each meter contributes at most per_meter readings, so one busy meter cannot
+    crowd out the rest; the merged list is newest first and cut to limit.
     """
-    # Try absolute readings first: look for readings at boundary timestamps
-    start_reading = (
-        db.query(MeterReading)
-        .filter(
-            and_(
-                MeterReading.meter_id == meter_id,
-                MeterReading.reading_timestamp == start_timestamp,
-                MeterReading.reading_type == ReadingType.ABSOLUTE,
+    if not meter_ids:
+        return []
+
+    ranked = (
+        select(
+            MeterReading.id,
+            func.row_number()
+            .over(
+                partition_by=MeterReading.meter_id,
+                order_by=MeterReading.reading_timestamp.desc(),
             )
+            .label("rank"),
         )
-        .first()
+        .where(MeterReading.meter_id.in_(meter_ids))
+        .subquery()
     )
-    end_reading = (
-        db.query(MeterReading)
-        .filter(
-            and_(
-                MeterReading.meter_id == meter_id,
-                MeterReading.reading_timestamp == end_timestamp,
-                MeterReading.reading_type == ReadingType.ABSOLUTE,
-            )
+    return list(
+        db.scalars(
+            select(MeterReading)
+            .join(ranked, ranked.c.id == MeterReading.id)
+            .where(ranked.c.rank <= per_meter)
+            .order_by(MeterReading.reading_timestamp.desc(), MeterReading.meter_id)
+            .limit(limit)
         )
-        .first()
     )
 
-    if start_reading and end_reading:
-        return end_reading.value - start_reading.value
 
-    # Fall back to relative readings: sum all relative readings in the period
-    relative_readings = (
-        db.query(MeterReading)
-        .filter(
-            and_(
-                MeterReading.meter_id == meter_id,
-                MeterReading.reading_type == ReadingType.RELATIVE,
-                MeterReading.reading_timestamp > start_timestamp,
-                MeterReading.reading_timestamp <= end_timestamp,
-            )
+def compute_meters_consumption_by_period(
+    db: Session,
+    meter_ids: list[int],
+    periods: list[tuple[datetime, datetime]],
+) -> list[dict[int, Decimal]]:
+    """Compute consumption for several meters over several periods in one query.
+
+    Supports both absolute and relative reading types, per meter and period:
+    - Absolute: consumption = end_reading - start_reading
+    - Relative: consumption = sum of all relative readings in the period
+
+    Both are aggregated in SQL, one row per meter and one column per period, with
+    the absolute difference taking precedence when both boundary readings exist.
+    Meters without readings in any period match no index entries and return no
+    row, so idle meters cost neither extra queries nor extra rows.
+
+    Periods must not overlap. Returns one {meter_id: consumption} dict per period;
+    meters without usable readings in a period are omitted from that period's dict.
+    """
+    if not meter_ids or not periods:
+        return [{} for _ in periods]
+
+    timestamp = MeterReading.reading_timestamp
+    is_absolute = MeterReading.reading_type == ReadingType.ABSOLUTE
+    is_relative = MeterReading.reading_type == ReadingType.RELATIVE
+
+    consumption_columns = []
+    in_periods = []
+    for start_timestamp, end_timestamp in periods:
+        in_period = and_(timestamp > start_timestamp, timestamp <= end_timestamp)
+        in_periods.append(in_period)
+        start_value = func.max(
+            case((and_(is_absolute, timestamp == start_timestamp), MeterReading.value))
+        )
+        end_value = func.max(
+            case((and_(is_absolute, timestamp == end_timestamp), MeterReading.value))
+        )
+        relative_total = func.sum(case((and_(is_relative, in_period), MeterReading.value)))
+        consumption_columns.append(func.coalesce(end_value - start_value, relative_total))
+
+    boundaries = list(dict.fromkeys(ts for period in periods for ts in period))
+    rows = db.execute(
+        select(MeterReading.meter_id, *consumption_columns)
+        .where(
+            MeterReading.meter_id.in_(meter_ids),
+            or_(
+                and_(is_absolute, timestamp.in_(boundaries)),
+                and_(is_relative, or_(*in_periods)),
+            ),
         )
-        .all()
+        .group_by(MeterReading.meter_id)
+    ).all()
+
+    results: list[dict[int, Decimal]] = [{} for _ in periods]
+    for meter_id, *consumptions in rows:
+        for period_consumptions, consumption in zip(results, consumptions, strict=True):
+            if consumption is not None:
+                period_consumptions[meter_id] = consumption
+    return results
+
+
+def compute_meters_consumption(
+    db: Session,
+    meter_ids: list[int],
+    start_timestamp: datetime,
+    end_timestamp: datetime,
+) -> dict[int, Decimal]:
+    """Compute consumption for several meters over a single period.
+
+    Meters without usable readings in the period are omitted from the result.
+    """
+    (consumptions,) = compute_meters_consumption_by_period(
+        db, meter_ids, [(start_timestamp, end_timestamp)]
     )
+    return consumptions
+
+
+def compute_meter_consumption(
+    db: Session,
+    meter_id: int,
+    start_timestamp: datetime,
+    end_timestamp: datetime,
+) -> Decimal | None:
+    """Compute consumption for a single meter over a period.
+
+    See compute_meters_consumption_by_period for how absolute and relative readings
+    are handled.
+    """
+    return compute_meters_consumption(db, [meter_id], start_timestamp, end_timestamp).get(meter_id)
+
+
+def get_property_consumption_by_period(
+    db: Session,
+    property_id: int,
+    periods: list[tuple[datetime, datetime]],
+) -> list[ConsumptionSummaryV2]:
+    """Calculate consumption for a property over several non-overlapping periods.
+
+    Loads the property's meters once and computes every period together, so the
+    query count does not grow with the number of periods.
+    """
+    main_meter, submeters = get_meters_split(db, property_id)
 
-    if relative_readings:
-        return sum((r.value for r in relative_readings), Decimal("0"))
+    meter_ids = [submeter.id for submeter in submeters]
+    if main_meter:
+        meter_ids.append(main_meter.id)
+    consumption_by_period = compute_meters_consumption_by_period(db, meter_ids, periods)
 
-    return None
+    return [
+        _build_consumption_summary(
+            property_id, start_timestamp, end_timestamp, main_meter, submeters, consumptions
+        )
+        for (start_timestamp, end_timestamp), consumptions in zip(
+            periods, consumption_by_period, strict=True
+        )
+    ]
 
 
 def get_property_consumption(
@@ -274,20 +490,27 @@ def get_property_consumption(
     Handles both absolute and relative reading types per meter.
     Includes unmetered consumption as a virtual submeter.
     """
-    main_meter = get_main_meter_for_property(db, property_id)
-    main_consumption: Decimal | None = None
+    (summary,) = get_property_consumption_by_period(
+        db, property_id, [(start_timestamp, end_timestamp)]
+    )
+    return summary
 
-    if main_meter:
-        main_consumption = compute_meter_consumption(
-            db, main_meter.id, start_timestamp, end_timestamp
-        )
 
-    submeters = get_submeters_for_property(db, property_id)
+def _build_consumption_summary(
+    property_id: int,
+    start_timestamp: datetime,
+    end_timestamp: datetime,
+    main_meter: Meter | None,
+    submeters: list[Meter],
+    consumption_by_meter: dict[int, Decimal],
+) -> ConsumptionSummaryV2:
+    """Assemble a consumption summary from precomputed per-meter consumption."""
+    main_consumption = consumption_by_meter.get(main_meter.id) if main_meter else None
     submeter_consumptions: list[SubMeterConsumptionV2] = []
     total_submetered = Decimal("0")
 
     for submeter in submeters:
-        consumption = compute_meter_consumption(db, submeter.id, start_timestamp, end_timestamp)
+        consumption = consumption_by_meter.get(submeter.id)
         if consumption is not None:
             total_submetered += consumption
             submeter_consumptions.append(
@@ -339,18 +562,18 @@ def compute_consumption_map(
     """
     consumptions: dict[str, Decimal] = {}
 
-    main_meter = get_main_meter_for_property(db, property_id)
-    main_consumption: Decimal | None = None
+    main_meter, submeters = get_meters_split(db, property_id)
+
+    meter_ids = [submeter.id for submeter in submeters]
     if main_meter:
-        main_consumption = compute_meter_consumption(
-            db, main_meter.id, start_timestamp, end_timestamp
-        )
+        meter_ids.append(main_meter.id)
+    consumption_by_meter = compute_meters_consumption(db, meter_ids, start_timestamp, end_timestamp)
 
-    submeters = get_submeters_for_property(db, property_id)
+    main_consumption = consumption_by_meter.get(main_meter.id) if main_meter else None
     total_submetered = Decimal("0")
 
     for submeter in submeters:
-        consumption = compute_meter_consumption(db, submeter.id, start_timestamp, end_timestamp)
+        consumption = consumption_by_meter.get(submeter.id)
         if consumption is not None:
             name = submeter.name or str(submeter.id)
             consumptions[name] = consumption
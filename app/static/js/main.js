@@ -23,6 +23,31 @@ document.querySelectorAll('[data-confirm]').forEach(function(element) {
     });
 });
 
+// Filter forms with data-results refresh only that element (readings list).
+// The server answers requests marked HX-Request with just the results fragment.
+document.querySelectorAll('form[data-results]').forEach(function(form) {
+    var results = document.getElementById(form.dataset.results);
+    if (!results) return;
+
+    form.addEventListener('submit', function(e) {
+        e.preventDefault();
+        var url = form.action + '?' + new URLSearchParams(new FormData(form)).toString();
+        fetch(url, { headers: { 'HX-Request': 'true' } })
+            .then(function(response) {
+                // Expired session: follow the redirect to the login page
+                if (response.redirected || !response.ok) throw new Error(response.url);
+                return response.text();
+            })
+            .then(function(html) {
+                results.innerHTML = html;
+                history.replaceState(null, '', url);
+            })
+            .catch(function() {
+                window.location = url;
+            });
+    });
+});
+
 // Action card accordion toggle (home page)
 function toggleActionCard(action) {
     var card = document.querySelector('[data-action="' + action + '"]');
@@ -1,22 +1,81 @@
 """Web-specific dependencies for session authentication."""
 
-from fastapi import Depends, Request
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.models.associations import user_property_association
+from app.models.property import Property
 from app.models.user import User
+from app.services.property import get_first_property_for_user
 
 
 def get_current_user_from_session(
     request: Request,
     db: Session = Depends(get_db),
 ) -> User | None:
-    """Get current user from session cookie."""
+    """Get current user from session cookie.
+
+    The user is remembered on request.state, so dependencies and handlers that
+    both ask for it within one request share a single lookup.
+    """
     user_id = request.session.get("user_id")
     if not user_id:
         return None
-    return db.query(User).filter(User.id == user_id).first()
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+    user = db.query(User).filter(User.id == user_id).first()
+    request.state.current_user = (user_id, user)
+    return user
+
+
+def resolve_user_and_property(
+    request: Request,
+    property_id: int | None = None,
+    db: Session = Depends(get_db),
+) -> tuple[User | None, Property | None]:
+    """Resolve the session user and the page's property with one joined query.
+
+    The property is the property_id query parameter, else the user's default
+    property while it is still one of theirs, else (with a second query) the first
+    property the user belongs to. Only an explicit property_id that does not exist
+    is a 404. Returns (None, None) when not logged in and (user, None) when the
+    user has no property yet.
+    """
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return None, None
+
+    if property_id:
+        property_match = Property.id == property_id
+    else:
+        property_match = and_(
+            Property.id == User.default_property_id,
+            Property.id.in_(
+                select(user_property_association.c.property_id).where(
+                    user_property_association.c.user_id == User.id
+                )
+            ),
+        )
+    row = db.execute(
+        select(User, Property).outerjoin(Property, property_match).where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None, None
+
+    user, prop = row
+    request.state.current_user = (user_id, user)
+    if prop is None and property_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Property not found",
+        )
+    if prop is None:
+        prop = get_first_property_for_user(db, user.id)
+    return user, prop
 
 
 def require_auth(
@@ -40,7 +99,13 @@ def get_flash_messages(request: Request) -> list[dict]:
 
 
 def add_flash_message(request: Request, message: str, category: str = "info") -> None:
-    """Add a flash message to the session."""
-    if "flash_messages" not in request.session:
-        request.session["flash_messages"] = []
-    request.session["flash_messages"].append({"message": message, "category": category})
+    """Add a flash message to the session.
+
+    The list is reassigned rather than appended to in place: SessionMiddleware only
+    re-signs the cookie when a key is set, and does so once per response however
+    many messages are added.
+    """
+    request.session["flash_messages"] = [
+        *request.session.get("flash_messages", []),
+        {"message": message, "category": category},
+    ]
@@ -9,8 +9,7 @@ from app.schemas.user import UserCreate
 from app.services.auth import (
     authenticate_user,
     create_user,
-    get_user_by_email,
-    get_user_by_username,
+    get_users_by_username_or_email,
 )
 from app.web.dependencies import add_flash_message, get_current_user_from_session
 from app.web.template_config import templates
@@ -34,7 +33,7 @@ async def login_page(
 
 
 @router.post("/login", response_class=HTMLResponse, response_model=None)
-async def login(
+def login(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
@@ -72,7 +71,7 @@ async def register_page(
 
 
 @router.post("/register", response_class=HTMLResponse, response_model=None)
-async def register(
+def register(
     request: Request,
     username: str = Form(...),
     email: str = Form(...),
@@ -89,10 +88,12 @@ async def register(
     if len(password) < 8:
         errors["password"] = "Password must be at least 8 characters"
 
-    if get_user_by_username(db, username):
+    existing = get_users_by_username_or_email(db, username, email)
+
+    if any(u.username == username for u in existing):
         errors["username"] = "Username already taken"
 
-    if get_user_by_email(db, email):
+    if any(u.email == email for u in existing):
         errors["email"] = "Email already registered"
 
     if errors:
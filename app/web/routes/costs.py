@@ -9,10 +9,11 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.services.property import get_properties_for_user, get_property
+from app.models.property import Property
+from app.models.user import User
 from app.services.v2.billing import distribute_costs
-from app.services.v2.readings import get_property_consumption
-from app.web.dependencies import add_flash_message, get_current_user_from_session
+from app.services.v2.readings import get_property_consumption_by_period
+from app.web.dependencies import add_flash_message, resolve_user_and_property
 from app.web.template_config import templates
 
 # Submeter colors for trend charts
@@ -53,31 +54,22 @@ def _next_month(year: int, month: int) -> tuple[int, int]:
 
 
 @router.get("/costs", response_class=HTMLResponse, response_model=None)
-async def cost_breakdown(
+def cost_breakdown(
     request: Request,
-    property_id: int | None = None,
     total_cost: float = 0,
     year: int | None = None,
     month: int | None = None,
     db: Session = Depends(get_db),
+    resolved: tuple[User | None, Property | None] = Depends(resolve_user_and_property),
 ) -> HTMLResponse | RedirectResponse:
     """Display monthly cost breakdown page."""
-    user = get_current_user_from_session(request, db)
+    user, prop = resolved
     if not user:
         return RedirectResponse("/login?next=/costs", status_code=303)
-
-    # Resolve property
-    if not property_id:
-        property_id = user.default_property_id
-    if not property_id:
-        properties = get_properties_for_user(db, user.id)
-        if properties:
-            property_id = properties[0].id
-        else:
-            add_flash_message(request, "Create a property first.", "info")
-            return RedirectResponse("/properties/create", status_code=303)
-
-    prop = get_property(db, property_id)
+    if not prop:
+        add_flash_message(request, "Create a property first.", "info")
+        return RedirectResponse("/properties/create", status_code=303)
+    property_id = prop.id
 
     # Default to previous month if no date specified
     now = datetime.now(UTC)
@@ -106,7 +98,7 @@ async def cost_breakdown(
             "user": user,
             "active_tab": "costs",
             "property_id": property_id,
-            "property_name": prop.display_name if prop else "Unknown",
+            "property_name": prop.display_name,
             "total_cost": float(cost_decimal),
             "year": year,
             "month": month,
@@ -121,120 +113,89 @@ async def cost_breakdown(
 
 
 @router.get("/trends", response_class=HTMLResponse, response_model=None)
-async def trends_overview(
+def trends_overview(
     request: Request,
-    property_id: int | None = None,
     db: Session = Depends(get_db),
+    resolved: tuple[User | None, Property | None] = Depends(resolve_user_and_property),
 ) -> HTMLResponse | RedirectResponse:
     """Display consumption trend overview."""
-    user = get_current_user_from_session(request, db)
+    user, prop = resolved
     if not user:
         return RedirectResponse("/login?next=/trends", status_code=303)
-
-    # Resolve property
-    if not property_id:
-        property_id = user.default_property_id
-    if not property_id:
-        properties = get_properties_for_user(db, user.id)
-        if properties:
-            property_id = properties[0].id
-        else:
-            add_flash_message(request, "Create a property first.", "info")
-            return RedirectResponse("/properties/create", status_code=303)
-
-    prop = get_property(db, property_id)
+    if not prop:
+        add_flash_message(request, "Create a property first.", "info")
+        return RedirectResponse("/properties/create", status_code=303)
+    property_id = prop.id
 
     # Collect last 6 months of consumption data
     now = datetime.now(UTC)
-    months_data: list[dict] = []
-    all_submeter_data: dict[str, list[dict]] = {}
-
+    months: list[tuple[int, int]] = []
     y, m = now.year, now.month
     for _ in range(6):
         y, m = _prev_month(y, m)
-        start, end = _month_bounds(y, m)
-        label = calendar.month_abbr[m]
-
-        try:
-            consumption = get_property_consumption(db, property_id, start, end)
-            total = float(consumption.main_meter_consumption or 0)
+        months.append((y, m))
+    # Oldest first (left to right)
+    months.reverse()
+
+    # All six months are computed together in a fixed number of queries
+    try:
+        summaries = get_property_consumption_by_period(
+            db, property_id, [_month_bounds(y, m) for y, m in months]
+        )
+    except Exception:
+        summaries = [None] * len(months)
+
+    # Single pass; the chart scale is tracked while building
+    months_data: list[dict] = []
+    max_total = 0
+    for (y, m), consumption in zip(months, summaries, strict=True):
+        if consumption is None:
+            total = 0
+            real_submeters = []
+        else:
+            main_total = float(consumption.main_meter_consumption or 0)
+            total = round(main_total, 1) if main_total else 0
             real_submeters = [s for s in consumption.submeters if not s.is_virtual]
-            months_data.append(
-                {
-                    "label": label,
-                    "total": round(total, 1) if total else 0,
-                    "year": y,
-                    "month": m,
-                    "submeters": real_submeters,
-                }
-            )
-            for sub in real_submeters:
-                if sub.name not in all_submeter_data:
-                    all_submeter_data[sub.name] = []
-                all_submeter_data[sub.name].append(
-                    {
-                        "month": f"{y}-{m:02d}",
-                        "consumption": float(sub.consumption),
-                    }
-                )
-        except Exception:
-            months_data.append(
-                {
-                    "label": label,
-                    "total": 0,
-                    "year": y,
-                    "month": m,
-                    "submeters": [],
-                }
-            )
-
-    # Reverse so oldest is first (left to right)
-    months_data.reverse()
-
-    max_total = max((md["total"] for md in months_data), default=0)
-
-    # Latest month submeter breakdown
-    latest_submeters: list[dict] = []
-    max_submeter = Decimal("0")
-    latest_month_label = ""
-
-    if months_data:
-        latest = months_data[-1]
-        latest_month_label = latest["label"]
-        for i, sub in enumerate(latest["submeters"]):
-            color = SUBMETER_COLORS[i % len(SUBMETER_COLORS)]
-            latest_submeters.append(
-                {
-                    "name": sub.name,
-                    "consumption": float(sub.consumption),
-                    "color": color,
-                }
-            )
-            if sub.consumption > max_submeter:
-                max_submeter = sub.consumption
+        if total > max_total:
+            max_total = total
+        months_data.append(
+            {
+                "label": calendar.month_abbr[m],
+                "total": total,
+                "year": y,
+                "month": m,
+                "submeters": real_submeters,
+            }
+        )
+
+    # Latest month submeter breakdown, converting each consumption to float once
+    latest = months_data[-1]
+    latest_month_label = latest["label"]
+    curr_subs = {s.name: float(s.consumption) for s in latest["submeters"]}
+    colors = SUBMETER_COLORS
+    n_colors = len(colors)
+    latest_submeters = [
+        {"name": name, "consumption": value, "color": colors[i % n_colors]}
+        for i, (name, value) in enumerate(curr_subs.items())
+    ]
+    max_submeter = max([0.0, *curr_subs.values()])
 
     # Month-over-month changes (compare last two months)
+    prev_subs = {s.name: float(s.consumption) for s in months_data[-2]["submeters"]}
     mom_changes: list[dict] = []
-    if len(months_data) >= 2:
-        prev_month_data = months_data[-2]
-        curr_month_data = months_data[-1]
-
-        prev_subs = {s.name: float(s.consumption) for s in prev_month_data["submeters"]}
-        curr_subs = {s.name: float(s.consumption) for s in curr_month_data["submeters"]}
-
-        all_names = list(dict.fromkeys(list(prev_subs.keys()) + list(curr_subs.keys())))
-        for name in all_names:
-            prev_val = prev_subs.get(name, 0)
-            curr_val = curr_subs.get(name, 0)
-            pct = round((curr_val - prev_val) / prev_val * 100) if prev_val > 0 else 0
-            mom_changes.append(
-                {
-                    "name": name,
-                    "prev": round(prev_val, 1),
-                    "curr": round(curr_val, 1),
-                    "pct": pct,
-                }
-            )
+    # Merging keeps first-seen order: previous month's names, then new ones
+    for name in {**prev_subs, **curr_subs}:
+        prev_val = prev_subs.get(name, 0)
+        curr_val = curr_subs.get(name, 0)
+        pct = round((curr_val - prev_val) / prev_val * 100) if prev_val > 0 else 0
+        mom_changes.append(
+            {
+                "name": name,
+                "prev": round(prev_val, 1),
+                "curr": round(curr_val, 1),
+                "pct": pct,
+            }
+        )
 
     return templates.TemplateResponse(
         request,
@@ -243,11 +204,11 @@ async def trends_overview(
             "user": user,
             "active_tab": "trends",
             "property_id": property_id,
-            "property_name": prop.display_name if prop else "Unknown",
+            "property_name": prop.display_name,
             "months": months_data,
             "max_total": max_total,
             "latest_submeters": latest_submeters,
-            "max_submeter": float(max_submeter),
+            "max_submeter": max_submeter,
             "latest_month_label": latest_month_label,
             "mom_changes": mom_changes,
         },
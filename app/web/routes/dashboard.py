@@ -7,10 +7,12 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.models.meter_reading import MeterReading
-from app.services.meter import get_meters_for_property
+from app.services.meter import get_meters_for_properties
 from app.services.property import get_properties_for_user
-from app.services.v2.readings import get_latest_readings_for_property
+from app.services.v2.readings import (
+    get_latest_readings_for_properties,
+    get_property_activity_counts,
+)
 from app.web.dependencies import get_current_user_from_session
 from app.web.template_config import templates
 
@@ -18,7 +20,7 @@ router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def dashboard(
+def dashboard(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -41,35 +43,25 @@ async def dashboard(
     now = datetime.now(UTC)
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-    property_summaries = []
-    all_meter_ids = []
+    property_ids = [prop.id for prop in properties]
+    counts_by_property = get_property_activity_counts(db, user.id, month_start)
+    meters_by_property = get_meters_for_properties(db, property_ids)
+    latest_by_property = get_latest_readings_for_properties(db, meters_by_property)
 
+    property_summaries = []
     for prop in properties:
-        meters = get_meters_for_property(db, prop.id)
-        stats["meters_count"] += len(meters)
-        all_meter_ids.extend([m.id for m in meters])
-
-        latest = get_latest_readings_for_property(db, prop.id)
+        meters_count, readings_count = counts_by_property.get(prop.id, (0, 0))
+        stats["meters_count"] += meters_count
+        stats["readings_this_month"] += readings_count
 
         property_summaries.append(
             {
                 "property": prop,
-                "meters_count": len(meters),
-                "latest_reading": latest,
+                "meters_count": meters_count,
+                "latest_reading": latest_by_property[prop.id],
             }
         )
 
-    # Count readings this month
-    if all_meter_ids:
-        stats["readings_this_month"] = (
-            db.query(MeterReading)
-            .filter(
-                MeterReading.meter_id.in_(all_meter_ids),
-                MeterReading.reading_timestamp >= month_start,
-            )
-            .count()
-        )
-
     return templates.TemplateResponse(
         request,
         "dashboard/index.html",
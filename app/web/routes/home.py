@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.v2.readings import ReadingCreateV2
-from app.services.meter import get_meter
+from app.services.meter import get_meter, get_meters_for_property
 from app.services.property import get_properties_for_user, get_property
 from app.services.v2.readings import create_reading, get_latest_readings_for_property
 from app.web.dependencies import add_flash_message, get_current_user_from_session
@@ -19,13 +19,15 @@ router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def home(
+def home(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
     """Landing page with quick entry or login."""
     user = get_current_user_from_session(request, db)
 
+    # Anonymous visits stop here: without a session user_id nothing has queried,
+    # so the request Session never checked out a connection
     if not user:
         return templates.TemplateResponse(
             request,
@@ -48,10 +50,16 @@ async def home(
         add_flash_message(request, "Please set your default meter for quick readings.", "info")
         return RedirectResponse("/profile/edit?setup_defaults=1", status_code=303)
 
-    # Get default property and meter info
-    default_property = get_property(db, user.default_property_id)
-    default_meter = get_meter(db, user.default_meter_id)
-    latest_reading = get_latest_readings_for_property(db, user.default_property_id)
+    # Get default property and meter info, reusing rows already loaded for this request
+    default_property = next(
+        (prop for prop in properties if prop.id == user.default_property_id), None
+    ) or get_property(db, user.default_property_id)
+    meters = get_meters_for_property(db, default_property.id)
+    default_meter = next(
+        (meter for meter in meters if meter.id == user.default_meter_id), None
+    ) or get_meter(db, user.default_meter_id)
+    # The property's meters are cached on the session, so this only queries the readings
+    latest_reading = get_latest_readings_for_property(db, default_property.id)
 
     return templates.TemplateResponse(
         request,
@@ -67,7 +75,7 @@ async def home(
 
 
 @router.post("/quick-reading", response_class=HTMLResponse, response_model=None)
-async def quick_reading(
+def quick_reading(
     request: Request,
     value: Decimal = Form(...),
     db: Session = Depends(get_db),
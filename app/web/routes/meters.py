@@ -10,19 +10,21 @@ from app.schemas.meter import MeterUpdate, SubMeterCreate
 from app.services.meter import (
     create_submeter,
     get_meter,
+    get_meter_with_property,
+    get_meters_for_properties,
     get_meters_for_property,
     update_meter,
 )
 from app.services.meter_reading import get_readings_history
 from app.services.property import get_properties_for_user, get_property
 from app.web.dependencies import add_flash_message, get_current_user_from_session
-from app.web.template_config import templates
+from app.web.template_config import templates, with_etag
 
 router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def list_meters(
+def list_meters(
     request: Request,
     property_id: int | None = None,
     db: Session = Depends(get_db),
@@ -38,30 +40,36 @@ async def list_meters(
     if property_id:
         # Filter by specific property
         meters = get_meters_for_property(db, property_id)
-        prop = get_property(db, property_id)
+        # Usually one of the user's properties, which are already loaded
+        prop = next((prop for prop in properties if prop.id == property_id), None)
+        if prop is None:
+            prop = get_property(db, property_id)
         for meter in meters:
             meters_data.append({"meter": meter, "property": prop})
     else:
-        # Show all meters for all properties
+        # Show all meters for all properties, fetched in one query
+        meters_by_property = get_meters_for_properties(db, [prop.id for prop in properties])
         for prop in properties:
-            meters = get_meters_for_property(db, prop.id)
-            for meter in meters:
+            for meter in meters_by_property[prop.id]:
                 meters_data.append({"meter": meter, "property": prop})
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "meters/list.html",
-        {
-            "user": user,
-            "meters": meters_data,
-            "properties": properties,
-            "selected_property_id": property_id,
-        },
+        templates.TemplateResponse(
+            request,
+            "meters/list.html",
+            {
+                "user": user,
+                "meters": meters_data,
+                "properties": properties,
+                "selected_property_id": property_id,
+            },
+        ),
     )
 
 
 @router.get("/create", response_class=HTMLResponse, response_model=None)
-async def create_meter_page(
+def create_meter_page(
     request: Request,
     property_id: int | None = None,
     db: Session = Depends(get_db),
@@ -85,7 +93,7 @@ async def create_meter_page(
 
 
 @router.post("/create", response_class=HTMLResponse, response_model=None)
-async def create_meter_submit(
+def create_meter_submit(
     request: Request,
     property_id: int = Form(...),
     name: str = Form(...),
@@ -97,7 +105,8 @@ async def create_meter_submit(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    meter_data = SubMeterCreate(
+    # Form(...) already typed these fields and the schema has no validators
+    meter_data = SubMeterCreate.model_construct(
         property_id=property_id,
         name=name,
         location=location or None,
@@ -110,7 +119,7 @@ async def create_meter_submit(
 
 
 @router.get("/{meter_id}", response_class=HTMLResponse, response_model=None)
-async def meter_detail(
+def meter_detail(
     request: Request,
     meter_id: int,
     db: Session = Depends(get_db),
@@ -120,25 +129,27 @@ async def meter_detail(
     if not user:
         return RedirectResponse(f"/login?next=/meters/{meter_id}", status_code=303)
 
-    meter = get_meter(db, meter_id)
-    prop = get_property(db, meter.property_id)
+    meter, prop = get_meter_with_property(db, meter_id)
     readings, total = get_readings_history(db, meter_id, limit=10)
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "meters/detail.html",
-        {
-            "user": user,
-            "meter": meter,
-            "property": prop,
-            "readings": readings,
-            "total_readings": total,
-        },
+        templates.TemplateResponse(
+            request,
+            "meters/detail.html",
+            {
+                "user": user,
+                "meter": meter,
+                "property": prop,
+                "readings": readings,
+                "total_readings": total,
+            },
+        ),
     )
 
 
 @router.get("/{meter_id}/edit", response_class=HTMLResponse, response_model=None)
-async def edit_meter_page(
+def edit_meter_page(
     request: Request,
     meter_id: int,
     db: Session = Depends(get_db),
@@ -148,8 +159,7 @@ async def edit_meter_page(
     if not user:
         return RedirectResponse(f"/login?next=/meters/{meter_id}/edit", status_code=303)
 
-    meter = get_meter(db, meter_id)
-    prop = get_property(db, meter.property_id)
+    meter, prop = get_meter_with_property(db, meter_id)
 
     return templates.TemplateResponse(
         request,
@@ -163,7 +173,7 @@ async def edit_meter_page(
 
 
 @router.post("/{meter_id}/edit", response_class=HTMLResponse, response_model=None)
-async def edit_meter_submit(
+def edit_meter_submit(
     request: Request,
     meter_id: int,
     name: str = Form(None),
@@ -187,7 +197,7 @@ async def edit_meter_submit(
 
 
 @router.post("/{meter_id}/delete", response_class=HTMLResponse, response_model=None)
-async def delete_meter(
+def delete_meter(
     request: Request,
     meter_id: int,
     db: Session = Depends(get_db),
@@ -206,10 +216,9 @@ async def delete_meter(
 
     property_id = meter.property_id
 
-    # Clear default if this was the default meter
+    # Clear default if this was the default meter, in the same commit as the delete
     if user.default_meter_id == meter_id:
         user.default_meter_id = None
-        db.commit()
 
     db.delete(meter)
     db.commit()
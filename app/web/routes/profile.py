@@ -6,16 +6,16 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.services.auth import get_password_hash, verify_password
-from app.services.meter import get_meters_for_property
+from app.services.meter import get_meters_for_properties
 from app.services.property import get_properties_for_user
 from app.web.dependencies import add_flash_message, get_current_user_from_session
-from app.web.template_config import templates
+from app.web.template_config import templates, with_etag
 
 router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def view_profile(
+def view_profile(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -24,15 +24,18 @@ async def view_profile(
     if not user:
         return RedirectResponse("/login?next=/profile", status_code=303)
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "profile/view.html",
-        {"user": user},
+        templates.TemplateResponse(
+            request,
+            "profile/view.html",
+            {"user": user},
+        ),
     )
 
 
 @router.get("/edit", response_class=HTMLResponse, response_model=None)
-async def edit_profile_page(
+def edit_profile_page(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -43,11 +46,8 @@ async def edit_profile_page(
 
     properties = get_properties_for_user(db, user.id)
 
-    # Build meters grouped by property
-    meters_by_property = {}
-    for prop in properties:
-        meters = get_meters_for_property(db, prop.id)
-        meters_by_property[prop.id] = meters
+    # Build meters grouped by property in one query
+    meters_by_property = get_meters_for_properties(db, [prop.id for prop in properties])
 
     setup_defaults = request.query_params.get("setup_defaults") == "1"
 
@@ -64,7 +64,7 @@ async def edit_profile_page(
 
 
 @router.post("/edit", response_class=HTMLResponse, response_model=None)
-async def edit_profile_submit(
+def edit_profile_submit(
     request: Request,
     phone_number: str = Form(""),
     default_property_id: int = Form(None),
@@ -87,7 +87,7 @@ async def edit_profile_submit(
 
 
 @router.get("/change-password", response_class=HTMLResponse, response_model=None)
-async def change_password_page(
+def change_password_page(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -104,7 +104,7 @@ async def change_password_page(
 
 
 @router.post("/change-password", response_class=HTMLResponse, response_model=None)
-async def change_password_submit(
+def change_password_submit(
     request: Request,
     current_password: str = Form(...),
     new_password: str = Form(...),
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.property import PropertyCreate, PropertyUpdate
-from app.services.meter import get_meters_for_property
+from app.services.meter import get_meters_for_properties, get_meters_for_property
 from app.services.meter_reading import get_latest_readings_for_property
 from app.services.property import (
     associate_user_with_property,
@@ -16,13 +16,13 @@ from app.services.property import (
     update_property,
 )
 from app.web.dependencies import add_flash_message, get_current_user_from_session
-from app.web.template_config import templates
+from app.web.template_config import templates, with_etag
 
 router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def list_properties(
+def list_properties(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -33,29 +33,32 @@ async def list_properties(
 
     properties = get_properties_for_user(db, user.id)
 
-    # Enrich with meter counts
+    # Enrich with meter counts, fetched for all properties in one query
+    meters_by_property = get_meters_for_properties(db, [prop.id for prop in properties])
     property_data = []
     for prop in properties:
-        meters = get_meters_for_property(db, prop.id)
         property_data.append(
             {
                 "property": prop,
-                "meters_count": len(meters),
+                "meters_count": len(meters_by_property[prop.id]),
             }
         )
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "properties/list.html",
-        {
-            "user": user,
-            "properties": property_data,
-        },
+        templates.TemplateResponse(
+            request,
+            "properties/list.html",
+            {
+                "user": user,
+                "properties": property_data,
+            },
+        ),
     )
 
 
 @router.get("/create", response_class=HTMLResponse, response_model=None)
-async def create_property_page(
+def create_property_page(
     request: Request,
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
@@ -77,7 +80,7 @@ async def create_property_page(
 
 
 @router.post("/create", response_class=HTMLResponse, response_model=None)
-async def create_property_submit(
+def create_property_submit(
     request: Request,
     display_name: str = Form(...),
     address: str = Form(""),
@@ -88,27 +91,30 @@ async def create_property_submit(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    property_data = PropertyCreate(display_name=display_name, address=address or None)
-    new_property = create_property(db, property_data)
+    # Form(...) already typed these fields and the schema has no validators
+    property_data = PropertyCreate.model_construct(
+        display_name=display_name, address=address or None
+    )
+    # Property, main meter, association and defaults are committed together
+    new_property = create_property(db, property_data, commit=False)
 
     # Associate user with property
-    associate_user_with_property(db, user.id, new_property.id)
+    associate_user_with_property(db, user.id, new_property.id, commit=False)
 
     # If this is the user's first property, set it as default
     if not user.default_property_id:
         user.default_property_id = new_property.id
-        # Set default meter to the main meter
-        meters = get_meters_for_property(db, new_property.id)
-        if meters:
-            user.default_meter_id = meters[0].id
-        db.commit()
+        # Set default meter to the main meter created alongside the property
+        user.default_meter_id = new_property.meters[0].id
+    property_id = new_property.id
+    db.commit()
 
     add_flash_message(request, f"Property '{display_name}' created successfully!", "success")
-    return RedirectResponse(f"/properties/{new_property.id}", status_code=303)
+    return RedirectResponse(f"/properties/{property_id}", status_code=303)
 
 
 @router.get("/{property_id}", response_class=HTMLResponse, response_model=None)
-async def property_detail(
+def property_detail(
     request: Request,
     property_id: int,
     db: Session = Depends(get_db),
@@ -122,20 +128,23 @@ async def property_detail(
     meters = get_meters_for_property(db, property_id)
     latest_reading = get_latest_readings_for_property(db, property_id)
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "properties/detail.html",
-        {
-            "user": user,
-            "property": prop,
-            "meters": meters,
-            "latest_reading": latest_reading,
-        },
+        templates.TemplateResponse(
+            request,
+            "properties/detail.html",
+            {
+                "user": user,
+                "property": prop,
+                "meters": meters,
+                "latest_reading": latest_reading,
+            },
+        ),
     )
 
 
 @router.get("/{property_id}/edit", response_class=HTMLResponse, response_model=None)
-async def edit_property_page(
+def edit_property_page(
     request: Request,
     property_id: int,
     db: Session = Depends(get_db),
@@ -158,7 +167,7 @@ async def edit_property_page(
 
 
 @router.post("/{property_id}/edit", response_class=HTMLResponse, response_model=None)
-async def edit_property_submit(
+def edit_property_submit(
     request: Request,
     property_id: int,
     display_name: str = Form(...),
@@ -170,7 +179,9 @@ async def edit_property_submit(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    property_data = PropertyUpdate(display_name=display_name, address=address or None)
+    property_data = PropertyUpdate.model_construct(
+        display_name=display_name, address=address or None
+    )
     update_property(db, property_id, property_data)
 
     add_flash_message(request, "Property updated successfully!", "success")
@@ -178,7 +189,7 @@ async def edit_property_submit(
 
 
 @router.post("/{property_id}/delete", response_class=HTMLResponse, response_model=None)
-async def delete_property(
+def delete_property(
     request: Request,
     property_id: int,
     db: Session = Depends(get_db),
@@ -194,9 +205,8 @@ async def delete_property(
     if user.default_property_id == property_id:
         user.default_property_id = None
         user.default_meter_id = None
-        db.commit()
 
-    # Delete property (cascade will handle meters and readings)
+    # Delete property (cascade will handle meters and readings), in the same commit
     db.delete(prop)
     db.commit()
 
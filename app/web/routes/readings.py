@@ -3,27 +3,48 @@
 from datetime import UTC, datetime
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Form, Request
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import FormData
 
 from app.core.database import get_db
 from app.schemas.v2.readings import BulkReadingCreateV2, ReadingCreateV2
-from app.services.meter import get_meter, get_meters_for_property
+from app.services.meter import (
+    get_meter_with_property,
+    get_meters_for_properties,
+    get_meters_for_property,
+)
 from app.services.property import get_properties_for_user, get_property
 from app.services.v2.readings import (
     create_bulk_readings,
     create_reading,
     get_readings_history,
+    get_recent_readings,
 )
 from app.web.dependencies import add_flash_message, get_current_user_from_session
-from app.web.template_config import templates
+from app.web.template_config import templates, with_etag
 
 router = APIRouter()
 
 
+def _parse_reading_date(reading_date: str | None) -> datetime:
+    """Parse a submitted reading date, defaulting to now.
+
+    Browsers send datetime-local values without an offset, which are taken as UTC;
+    a value with an explicit offset is converted to UTC rather than relabelled.
+    """
+    if not reading_date or not reading_date.strip():
+        return datetime.now(UTC)
+    timestamp = datetime.fromisoformat(reading_date)
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC)
+
+
 @router.get("/", response_class=HTMLResponse, response_model=None)
-async def list_readings(
+def list_readings(
     request: Request,
     meter_id: int | None = None,
     db: Session = Depends(get_db),
@@ -34,13 +55,14 @@ async def list_readings(
         return RedirectResponse("/login?next=/readings", status_code=303)
 
     properties = get_properties_for_user(db, user.id)
+    # One meters query serves both the readings and the filter dropdown
+    meters_by_property = get_meters_for_properties(db, [prop.id for prop in properties])
 
     readings_data = []
     total = 0
 
     if meter_id:
-        meter = get_meter(db, meter_id)
-        prop = get_property(db, meter.property_id)
+        meter, prop = get_meter_with_property(db, meter_id)
         readings, total = get_readings_history(db, meter_id, limit=50)
         for reading in readings:
             readings_data.append(
@@ -51,47 +73,46 @@ async def list_readings(
                 }
             )
     else:
-        # Get recent readings across all meters
-        for prop in properties:
-            meters = get_meters_for_property(db, prop.id)
-            for meter in meters:
-                readings, _ = get_readings_history(db, meter.id, limit=10)
-                for reading in readings:
-                    readings_data.append(
-                        {
-                            "reading": reading,
-                            "meter": meter,
-                            "property": prop,
-                        }
-                    )
-
-        # Sort by timestamp descending
-        readings_data.sort(key=lambda x: x["reading"].reading_timestamp, reverse=True)
-        readings_data = readings_data[:50]
+        # Get recent readings across all meters in one query
+        meter_owners = {
+            meter.id: (meter, prop) for prop in properties for meter in meters_by_property[prop.id]
+        }
+        for reading in get_recent_readings(db, list(meter_owners), limit=50, per_meter=10):
+            meter, prop = meter_owners[reading.meter_id]
+            readings_data.append(
+                {
+                    "reading": reading,
+                    "meter": meter,
+                    "property": prop,
+                }
+            )
         total = len(readings_data)
 
-    # Build meters list for filtering
-    all_meters = []
-    for prop in properties:
-        meters = get_meters_for_property(db, prop.id)
-        for meter in meters:
-            all_meters.append({"meter": meter, "property": prop})
-
-    return templates.TemplateResponse(
-        request,
-        "readings/list.html",
-        {
-            "user": user,
-            "readings": readings_data,
-            "total": total,
-            "meters": all_meters,
-            "selected_meter_id": meter_id,
-        },
-    )
+    context = {
+        "user": user,
+        "readings": readings_data,
+        "total": total,
+        "selected_meter_id": meter_id,
+    }
+    if request.headers.get("hx-request"):
+        # The list page's filter swaps in just the results, so skip the page chrome
+        response = templates.TemplateResponse(request, "readings/_results.html", context)
+    else:
+        # Build meters list for filtering
+        all_meters = []
+        for prop in properties:
+            for meter in meters_by_property[prop.id]:
+                all_meters.append({"meter": meter, "property": prop})
+        response = templates.TemplateResponse(
+            request, "readings/list.html", {**context, "meters": all_meters}
+        )
+    # Same URL, two bodies: keep caches from serving one in place of the other
+    response.headers["Vary"] = "HX-Request"
+    return response
 
 
 @router.get("/create", response_class=HTMLResponse, response_model=None)
-async def create_reading_page(
+def create_reading_page(
     request: Request,
     meter_id: int | None = None,
     property_id: int | None = None,
@@ -104,11 +125,8 @@ async def create_reading_page(
 
     properties = get_properties_for_user(db, user.id)
 
-    # Build meters grouped by property
-    meters_by_property = {}
-    for prop in properties:
-        meters = get_meters_for_property(db, prop.id)
-        meters_by_property[prop.id] = meters
+    # Build meters grouped by property in one query
+    meters_by_property = get_meters_for_properties(db, [prop.id for prop in properties])
 
     return templates.TemplateResponse(
         request,
@@ -124,7 +142,7 @@ async def create_reading_page(
 
 
 @router.post("/create", response_class=HTMLResponse, response_model=None)
-async def create_reading_submit(
+def create_reading_submit(
     request: Request,
     meter_id: int = Form(...),
     value: Decimal = Form(...),
@@ -136,11 +154,7 @@ async def create_reading_submit(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    # Parse timestamp or use now
-    if reading_date:
-        timestamp = datetime.fromisoformat(reading_date).replace(tzinfo=UTC)
-    else:
-        timestamp = datetime.now(UTC)
+    timestamp = _parse_reading_date(reading_date)
 
     reading_data = ReadingCreateV2(
         meter_id=meter_id,
@@ -154,7 +168,7 @@ async def create_reading_submit(
 
 
 @router.get("/bulk", response_class=HTMLResponse, response_model=None)
-async def bulk_reading_page(
+def bulk_reading_page(
     request: Request,
     property_id: int | None = None,
     db: Session = Depends(get_db),
@@ -171,7 +185,12 @@ async def bulk_reading_page(
     selected_property = None
 
     if selected_property_id:
-        selected_property = get_property(db, selected_property_id)
+        # Usually one of the user's properties, which are already loaded
+        selected_property = next(
+            (prop for prop in properties if prop.id == selected_property_id), None
+        )
+        if selected_property is None:
+            selected_property = get_property(db, selected_property_id)
         meters = get_meters_for_property(db, selected_property_id)
 
     return templates.TemplateResponse(
@@ -193,32 +212,44 @@ async def bulk_reading_submit(
     db: Session = Depends(get_db),
 ) -> HTMLResponse | RedirectResponse:
     """Process bulk reading form."""
+    # Submeter fields are dynamic, so the form is read here; the DB work runs in the threadpool
+    form_data = await request.form()
+    return await run_in_threadpool(_save_bulk_readings, request, db, form_data)
+
+
+def _save_bulk_readings(
+    request: Request,
+    db: Session,
+    form_data: FormData,
+) -> RedirectResponse:
+    """Record the readings from a submitted bulk form."""
     user = get_current_user_from_session(request, db)
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    form_data = await request.form()
-
     property_id_str = form_data.get("property_id")
     main_meter_str = form_data.get("main_meter_value")
     reading_date_str = form_data.get("reading_date")
 
-    # Ensure we have valid string values
-    property_id = int(str(property_id_str))
-    main_meter_value = Decimal(str(main_meter_str))
-
-    # Parse timestamp
-    if reading_date_str and str(reading_date_str).strip():
-        timestamp = datetime.fromisoformat(str(reading_date_str)).replace(tzinfo=UTC)
-    else:
-        timestamp = datetime.now(UTC)
-
-    # Collect submeter readings
-    submeter_readings = {}
-    for key, value in form_data.items():
-        if key.startswith("submeter_") and value:
-            name = key.replace("submeter_", "")
-            submeter_readings[name] = Decimal(str(value))
+    # Text fields arrive as str; anything else (missing field, file upload) is a bad form
+    if not isinstance(property_id_str, str) or not isinstance(main_meter_str, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Property and main meter value are required",
+        )
+    property_id = int(property_id_str)
+    main_meter_value = Decimal(main_meter_str)
+
+    timestamp = _parse_reading_date(reading_date_str if isinstance(reading_date_str, str) else None)
+
+    # Collect submeter readings in one pass; strip only the leading prefix so a
+    # submeter whose own name contains "submeter_" keeps it. Text fields are already
+    # str, so the isinstance check only filters out file uploads
+    submeter_readings = {
+        key.removeprefix("submeter_"): Decimal(value)
+        for key, value in form_data.items()
+        if isinstance(value, str) and value and key.startswith("submeter_")
+    }
 
     bulk_data = BulkReadingCreateV2(
         property_id=property_id,
@@ -237,7 +268,7 @@ async def bulk_reading_submit(
 
 
 @router.get("/meter/{meter_id}/history", response_class=HTMLResponse, response_model=None)
-async def meter_history(
+def meter_history(
     request: Request,
     meter_id: int,
     page: int = 1,
@@ -248,8 +279,7 @@ async def meter_history(
     if not user:
         return RedirectResponse(f"/login?next=/readings/meter/{meter_id}/history", status_code=303)
 
-    meter = get_meter(db, meter_id)
-    prop = get_property(db, meter.property_id)
+    meter, prop = get_meter_with_property(db, meter_id)
 
     limit = 20
     offset = (page - 1) * limit
@@ -257,16 +287,19 @@ async def meter_history(
 
     total_pages = (total + limit - 1) // limit
 
-    return templates.TemplateResponse(
+    return with_etag(
         request,
-        "readings/history.html",
-        {
-            "user": user,
-            "meter": meter,
-            "property": prop,
-            "readings": readings,
-            "total": total,
-            "page": page,
-            "total_pages": total_pages,
-        },
+        templates.TemplateResponse(
+            request,
+            "readings/history.html",
+            {
+                "user": user,
+                "meter": meter,
+                "property": prop,
+                "readings": readings,
+                "total": total,
+                "page": page,
+                "total_pages": total_pages,
+            },
+        ),
     )
@@ -1,9 +1,45 @@
 """Jinja2 template configuration."""
 
+import hashlib
 from pathlib import Path
 
+from fastapi import Request
+from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.core.config import settings
 
 # Template directory is at app/templates/
 BASE_DIR = Path(__file__).resolve().parent.parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates only change on deploy; outside debug skip the per-render mtime check
+templates.env.auto_reload = settings.DEBUG
+if not settings.DEBUG:
+    # Share compiled templates between workers and restarts via the temp dir; entries
+    # are keyed by source checksum, so a deploy with changed templates recompiles them
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+def precompile_templates() -> None:
+    """Compile every template up front so the first request to each page skips it.
+
+    The environment's default cache (400 entries) holds all of them, so none are evicted.
+    """
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+
+
+def with_etag(request: Request, response: HTMLResponse) -> HTMLResponse:
+    """Tag a rendered page and answer 304 when the browser already has this exact body.
+
+    The tag is a hash of the rendered HTML, so it saves the transfer, not the render.
+    """
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    # private: pages are per-user; no-cache: always revalidate before reuse
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return HTMLResponse(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,178 @@
+"""Shared pytest configuration."""
+
+import os
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from decimal import Decimal
+
+# Point the app at a private in-memory database before anything imports its settings.
+# Shared cache lets every pooled connection see the same database, and the pool keeps
+# a connection open, so it lives for the whole test session without touching disk.
+os.environ["DATABASE_URL"] = "sqlite:///file:electric_tests?mode=memory&cache=shared&uri=true"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.enums import MeterType, ReadingType  # noqa: E402
+from app.models.meter_reading import MeterReading  # noqa: E402
+from app.models.property import Property  # noqa: E402
+from app.schemas.meter import SubMeterCreate  # noqa: E402
+from app.schemas.property import PropertyCreate  # noqa: E402
+from app.services.meter import create_submeter  # noqa: E402
+from app.services.property import create_property  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def database_schema():
+    """Create the schema once, for tests that use the app database without a lifespan."""
+    Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture(autouse=True, scope="class")
+def database_connection(database_schema):
+    """Hold one outer transaction per test class that is rolled back afterwards.
+
+    Every SessionLocal session (the app's get_db and tests alike) joins that
+    transaction, and its commits only release a SAVEPOINT, so nothing needs reseeding.
+    Class-scoped fixtures can write shared rows here; each test then runs inside its
+    own savepoint (see rollback_database).
+    """
+    connection = engine.connect()
+    # pysqlite only opens a transaction before DML, so a leading SAVEPOINT would run
+    # outside one and its RELEASE would commit. Issue BEGIN ourselves instead.
+    sqlite_connection = connection.connection.driver_connection
+    sqlite_connection.isolation_level = None
+    transaction = connection.begin()
+    connection.exec_driver_sql("BEGIN")
+    SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    yield connection
+    SessionLocal.configure(bind=engine, join_transaction_mode="conservative_savepoint")
+    transaction.rollback()
+    sqlite_connection.isolation_level = ""
+    connection.close()
+
+
+@pytest.fixture(autouse=True)
+def rollback_database(database_connection):
+    """Roll back each test's writes, so no test sees another's rows."""
+    savepoint = database_connection.begin_nested()
+    yield database_connection
+    savepoint.rollback()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hashing():
+    """Hash test passwords at bcrypt's minimum cost; verification is unchanged."""
+    original = settings.BCRYPT_ROUNDS
+    settings.BCRYPT_ROUNDS = 4
+    yield
+    settings.BCRYPT_ROUNDS = original
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client, running the app lifespan once for the whole session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def web_client(client):
+    """The shared client with an empty cookie jar, for tests that log in to the web UI."""
+    client.cookies.clear()
+    yield client
+    client.cookies.clear()
+
+
+@pytest.fixture
+def logged_in_client(web_client):
+    """The web client with a freshly registered user logged in.
+
+    Registration's welcome flash is already shown by the followed redirect.
+    """
+    web_client.post(
+        "/register",
+        data={
+            "username": "web_user",
+            "email": "web_user@example.com",
+            "password": "secret123",
+            "password_confirm": "secret123",
+        },
+    )
+    return web_client
+
+
+@pytest.fixture
+def db_session():
+    """A session inside the test's rolled-back transaction."""
+    with SessionLocal() as db:
+        yield db
+
+
+def _create_property(db: Session, display_name: str, submeters: Iterable[str]) -> Property:
+    """Create a property with its main meter and named submeters through the services."""
+    prop = create_property(db, PropertyCreate(display_name=display_name))
+    for name in submeters:
+        create_submeter(db, SubMeterCreate(property_id=prop.id, name=name))
+    return prop
+
+
+@pytest.fixture
+def make_property(db_session) -> Callable[..., Property]:
+    """Factory for a property with its main meter and named submeters.
+
+    Goes through the services rather than the API, for tests that only need the ids.
+    """
+
+    def make(display_name: str = "Test Property", submeters: Iterable[str] = ()) -> Property:
+        return _create_property(db_session, display_name, submeters)
+
+    return make
+
+
+@pytest.fixture(scope="class")
+def reading_property(database_connection) -> tuple[int, int, dict[str, int]]:
+    """A property with submeters gg and sg, built once per test class.
+
+    Returns (property_id, main_meter_id, submeter_ids_by_name). Each test's readings
+    are still rolled back; only the property and its meters outlive a test.
+    """
+    with SessionLocal() as db:
+        prop = _create_property(db, "Reading Property", ("gg", "sg"))
+        main_meter_id = next(m.id for m in prop.meters if m.meter_type == MeterType.MAIN_METER)
+        submeter_ids = {m.name: m.id for m in prop.meters if m.meter_type == MeterType.SUB_METER}
+        return prop.id, main_meter_id, submeter_ids
+
+
+@pytest.fixture
+def add_readings(db_session) -> Callable[..., None]:
+    """Factory writing (timestamp, value) readings for a meter in one INSERT.
+
+    For tests that assert on the services rather than the readings API.
+    """
+
+    def add(
+        meter_id: int,
+        readings: Iterable[tuple[datetime, Decimal]],
+        reading_type: ReadingType = ReadingType.ABSOLUTE,
+    ) -> None:
+        db_session.execute(
+            insert(MeterReading),
+            [
+                {
+                    "meter_id": meter_id,
+                    "reading_timestamp": timestamp,
+                    "value": value,
+                    "reading_type": reading_type,
+                }
+                for timestamp, value in readings
+            ],
+        )
+        db_session.commit()
+
+    return add
@@ -4,13 +4,8 @@ from datetime import timedelta
 
 import pytest
 from fastapi import HTTPException
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
-from app.main import app
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.services.auth import (
@@ -21,51 +16,30 @@ from app.services.auth import (
     get_password_hash,
     get_user_by_email,
     get_user_by_username,
+    get_users_by_username_or_email,
     verify_password,
 )
 
 
-# Test database setup
 @pytest.fixture
-def test_db():
-    """Create an in-memory test database."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(bind=engine)
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = testing_session_local()
-    try:
-        yield db
-    finally:
-        db.close()
-
+def test_db(db_session):
+    """The shared session, inside the test's rolled-back transaction."""
+    return db_session
 
-@pytest.fixture
-def client(test_db):
-    """Create a test client with database override."""
 
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
-    app.dependency_overrides.clear()
+@pytest.fixture(scope="session")
+def test_user_password_hash():
+    """Hash the test user's password once; it is the same for every test."""
+    return get_password_hash("testpassword123")
 
 
 @pytest.fixture
-def test_user(test_db):
+def test_user(test_db, test_user_password_hash):
     """Create a test user in the database."""
-    hashed_password = get_password_hash("testpassword123")
     user = User(
         username="testuser",
         email="test@example.com",
-        hashed_password=hashed_password,
+        hashed_password=test_user_password_hash,
     )
     test_db.add(user)
     test_db.commit()
@@ -196,6 +170,15 @@ class TestUserDatabaseOperations:
         user = get_user_by_email(test_db, "nonexistent@example.com")
         assert user is None
 
+    def test_get_users_by_username_or_email(self, test_db, test_user):
+        """Test get_users_by_username_or_email matches on either field."""
+        by_username = get_users_by_username_or_email(test_db, "testuser", "other@example.com")
+        by_email = get_users_by_username_or_email(test_db, "other", "test@example.com")
+        neither = get_users_by_username_or_email(test_db, "other", "other@example.com")
+        assert [u.id for u in by_username] == [test_user.id]
+        assert [u.id for u in by_email] == [test_user.id]
+        assert neither == []
+
     def test_authenticate_user_valid(self, test_db, test_user):
         """Test authenticate_user with valid credentials."""
         user = authenticate_user(test_db, "testuser", "testpassword123")
@@ -207,6 +190,18 @@ class TestUserDatabaseOperations:
         user = authenticate_user(test_db, "testuser", "wrongpassword")
         assert user is None
 
+    def test_authenticate_user_upgrades_weaker_hash(self, test_db, test_user, monkeypatch):
+        """Test a successful login rehashes a password stored below the configured cost."""
+        old_hash = test_user.hashed_password
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+        user = authenticate_user(test_db, "testuser", "testpassword123")
+
+        assert user is not None
+        assert user.hashed_password != old_hash
+        assert user.hashed_password.startswith("$2b$05$")
+        assert verify_password("testpassword123", user.hashed_password)
+
     def test_authenticate_user_nonexistent_user(self, test_db):
         """Test authenticate_user with non-existent user."""
         user = authenticate_user(test_db, "nonexistent", "password")
@@ -306,49 +301,25 @@ class TestRegisterEndpoint:
         assert response.status_code == 400
         assert "Email already registered" in response.json()["detail"]
 
-    def test_register_invalid_email(self, client):
-        """Test registration with invalid email format."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "username": "newuser",
-                "email": "not-an-email",
-                "password": "password123",
-            },
-        )
-        assert response.status_code == 422  # Validation error
-
-    def test_register_missing_username(self, client):
-        """Test registration with missing username."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "password123",
-            },
-        )
-        assert response.status_code == 422
-
-    def test_register_missing_email(self, client):
-        """Test registration with missing email."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "username": "newuser",
-                "password": "password123",
-            },
-        )
-        assert response.status_code == 422
-
-    def test_register_missing_password(self, client):
-        """Test registration with missing password."""
-        response = client.post(
-            "/api/auth/register",
-            json={
-                "username": "newuser",
-                "email": "test@example.com",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"username": "newuser", "email": "not-an-email", "password": "password123"},
+                id="invalid-email",
+            ),
+            pytest.param(
+                {"email": "test@example.com", "password": "password123"}, id="missing-username"
+            ),
+            pytest.param({"username": "newuser", "password": "password123"}, id="missing-email"),
+            pytest.param(
+                {"username": "newuser", "email": "test@example.com"}, id="missing-password"
+            ),
+        ],
+    )
+    def test_register_invalid_payload(self, client, payload):
+        """Test registration with an invalid or incomplete payload is a validation error."""
+        response = client.post("/api/auth/register", json=payload)
         assert response.status_code == 422
 
 
@@ -375,48 +346,33 @@ class TestLoginEndpoint:
         assert data["token_type"] == "bearer"
         assert len(data["access_token"]) > 0
 
-    def test_login_wrong_password(self, client, test_user):
-        """Test login with wrong password."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "username": "testuser",
-                "password": "wrongpassword",
-            },
-        )
-        assert response.status_code == 401
-        assert "Incorrect username or password" in response.json()["detail"]
-
-    def test_login_nonexistent_user(self, client):
-        """Test login with non-existent user."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "username": "nonexistent",
-                "password": "password123",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"username": "testuser", "password": "wrongpassword"}, id="wrong-password"
+            ),
+            pytest.param(
+                {"username": "nonexistent", "password": "password123"}, id="nonexistent-user"
+            ),
+        ],
+    )
+    def test_login_bad_credentials(self, client, test_user, payload):
+        """Test login with a wrong password or unknown user gets the same 401."""
+        response = client.post("/api/auth/login", json=payload)
         assert response.status_code == 401
         assert "Incorrect username or password" in response.json()["detail"]
 
-    def test_login_missing_username(self, client):
-        """Test login with missing username."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "password": "password123",
-            },
-        )
-        assert response.status_code == 422
-
-    def test_login_missing_password(self, client):
-        """Test login with missing password."""
-        response = client.post(
-            "/api/auth/login",
-            json={
-                "username": "testuser",
-            },
-        )
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"password": "password123"}, id="missing-username"),
+            pytest.param({"username": "testuser"}, id="missing-password"),
+        ],
+    )
+    def test_login_invalid_payload(self, client, payload):
+        """Test login with an incomplete payload is a validation error."""
+        response = client.post("/api/auth/login", json=payload)
         assert response.status_code == 422
 
     def test_login_token_is_valid(self, client, test_user):
@@ -1,13 +1,18 @@
 """Tests for main application endpoints."""
 
+import re
+
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
+from app.core.database import SessionLocal, engine
 from app.main import app
-
-client = TestClient(app)
+from app.services.meter import get_meters_for_property
+from app.web.template_config import precompile_templates
+from tests.utils.query_counter import count_queries
 
 
-def test_root_endpoint():
+def test_root_endpoint(client: TestClient):
     """Test root endpoint returns landing page HTML."""
     response = client.get("/")
     assert response.status_code == 200
@@ -16,10 +21,159 @@ def test_root_endpoint():
     assert "Meter Reading Tracker" in response.text
 
 
-def test_health_check():
+def test_root_endpoint_anonymous_skips_database():
+    """Test the anonymous landing page neither queries nor checks out a connection."""
+    checkouts = []
+
+    def on_checkout(dbapi_conn, conn_record, conn_proxy) -> None:
+        checkouts.append(conn_record)
+
+    event.listen(engine, "checkout", on_checkout)
+    try:
+        with count_queries(engine) as queries:
+            response = TestClient(app).get("/")
+    finally:
+        event.remove(engine, "checkout", on_checkout)
+
+    assert response.status_code == 200
+    assert queries == []
+    assert checkouts == []
+
+
+def test_health_check(client: TestClient):
     """Test health check endpoint."""
     response = client.get("/api/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert data["service"] == "electric"
+
+
+def test_readiness_check(client: TestClient):
+    """Test readiness probe reaches the database and reports pool status."""
+    response = client.get("/api/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert "Pool size" in data["pool"]
+
+
+def test_profile_page_revalidates_with_etag(logged_in_client: TestClient):
+    """Test an unchanged page answers If-None-Match with 304 and an empty body."""
+    first = logged_in_client.get("/profile/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = logged_in_client.get("/profile/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+    stale = logged_in_client.get("/profile/", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+
+
+def test_meter_history_etag_changes_with_new_reading(logged_in_client: TestClient):
+    """Test a cached history page is re-sent once the meter gets a new reading."""
+    created = logged_in_client.post(
+        "/properties/create", data={"display_name": "History Home"}, follow_redirects=False
+    )
+    property_id = created.headers["location"].rsplit("/", 1)[-1]
+    with SessionLocal() as db:
+        meter_id = get_meters_for_property(db, int(property_id))[0].id
+    history_url = f"/readings/meter/{meter_id}/history"
+    logged_in_client.get(history_url)  # consumes the pending "created" flash message
+
+    etag = logged_in_client.get(history_url).headers["etag"]
+    assert logged_in_client.get(history_url, headers={"If-None-Match": etag}).status_code == 304
+
+    logged_in_client.post("/readings/create", data={"meter_id": str(meter_id), "value": "42"})
+    refreshed = logged_in_client.get(history_url, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+
+
+def test_readings_filter_returns_results_fragment(logged_in_client: TestClient):
+    """Test the readings list answers HX-Request with only the results region."""
+    full = logged_in_client.get("/readings/")
+    assert "<html" in full.text
+    assert 'id="readings-results"' in full.text
+    assert "HX-Request" in full.headers["vary"]
+
+    fragment = logged_in_client.get("/readings/", headers={"HX-Request": "true"})
+    assert fragment.status_code == 200
+    assert "<html" not in fragment.text
+    assert "No readings found" in fragment.text
+    assert "HX-Request" in fragment.headers["vary"]
+
+
+def test_all_templates_compile():
+    """Test startup template precompilation succeeds for every template."""
+    precompile_templates()
+
+
+def test_flash_messages_accumulate_across_requests(logged_in_client: TestClient):
+    """Test a flash added while another is still pending survives to the next page."""
+    logged_in_client.post(
+        "/properties/create", data={"display_name": "Flash One"}, follow_redirects=False
+    )
+    logged_in_client.post(
+        "/properties/create", data={"display_name": "Flash Two"}, follow_redirects=False
+    )
+
+    page = logged_in_client.get("/profile/").text
+    assert "Property &#39;Flash One&#39; created successfully!" in page
+    assert "Property &#39;Flash Two&#39; created successfully!" in page
+
+
+def test_meters_list_filtered_reuses_loaded_property(logged_in_client: TestClient):
+    """Test filtering meters by one of the user's properties does not refetch it."""
+    created = logged_in_client.post(
+        "/properties/create", data={"display_name": "Filter Home"}, follow_redirects=False
+    )
+    property_id = created.headers["location"].rsplit("/", 1)[-1]
+
+    with count_queries(engine) as queries:
+        response = logged_in_client.get(f"/meters/?property_id={property_id}")
+
+    assert response.status_code == 200
+    assert "Filter Home" in response.text
+    # The property comes from the user's property list, not a second lookup by id
+    assert not any("WHERE properties.id = ?" in query for query in queries)
+
+
+def test_trends_foreign_default_property_falls_back_to_first(
+    logged_in_client: TestClient, make_property
+):
+    """Test a default property the user does not belong to falls back to their first one."""
+    logged_in_client.post("/properties/create", data={"display_name": "Own Home"})
+    foreign = make_property("Foreign Home")
+    logged_in_client.post("/profile/edit", data={"default_property_id": foreign.id})
+
+    for url in ("/trends", "/trends?property_id=0"):
+        response = logged_in_client.get(url)
+        assert response.status_code == 200
+        assert "Own Home" in response.text
+        assert "Foreign Home" not in response.text
+
+
+def test_trends_unknown_explicit_property_not_found(logged_in_client: TestClient):
+    """Test an explicit property_id that does not exist is a 404."""
+    logged_in_client.post("/properties/create", data={"display_name": "Known Home"})
+
+    assert logged_in_client.get("/trends?property_id=999999").status_code == 404
+
+
+def test_api_paths_resolve_to_api_routes(client: TestClient):
+    """Test web routes, matched first, never shadow an /api route.
+
+    Without credentials or a body every API operation answers with JSON; a web page
+    answering instead would send HTML or a redirect.
+    """
+    paths = {path: ops for path, ops in app.openapi()["paths"].items() if path.startswith("/api/")}
+    assert paths
+    for path, operations in paths.items():
+        url = re.sub(r"{[^}]+}", "1", path)
+        for method in operations:
+            response = client.request(method.upper(), url, follow_redirects=False)
+            assert response.headers["content-type"] == "application/json", f"{method} {url}"
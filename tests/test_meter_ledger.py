@@ -1,40 +1,51 @@
 """Tests for meter ledger functionality."""
 
+from collections.abc import Callable
+from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
 
-from app.main import app
+from app.core.database import SessionLocal
 from app.models.enums import MeterType, SubMeterKind
+from app.models.property import Property
+from app.schemas.meter import SubMeterCreate
+from app.services.meter import (
+    create_submeter,
+    get_main_meter_for_property,
+    get_meters_for_property,
+    get_meters_split,
+    get_submeters_for_property,
+)
 from app.services.meter_reading import compute_unmetered_value
-
-
-@pytest.fixture(scope="module")
-def client():
-    """Create a test client with proper lifespan handling."""
-    with TestClient(app) as c:
-        yield c
+from tests.utils.query_counter import count_queries
 
 
 class TestComputeUnmeteredValue:
     """Unit tests for the unmetered value computation."""
 
-    def test_basic_computation(self) -> None:
-        """Test basic unmetered calculation."""
-        result = compute_unmetered_value(
-            main_meter_value=Decimal("500.0"),
-            submeter_values=[Decimal("150.0"), Decimal("120.0"), Decimal("80.0")],
-        )
-        assert result == Decimal("150.0")
-
-    def test_with_no_submeters(self) -> None:
-        """Test when there are no submeters - all is unmetered."""
+    @pytest.mark.parametrize(
+        ("main_meter_value", "submeter_values", "expected"),
+        [
+            pytest.param("500.0", ["150.0", "120.0", "80.0"], "150.0", id="basic"),
+            pytest.param("500.0", [], "500.0", id="no-submeters-all-unmetered"),
+            pytest.param("100.0", ["150.0"], "0", id="negative-clamped-to-zero"),
+            pytest.param("200.0", ["100.0", "100.0"], "0", id="exact-match"),
+            pytest.param("0", ["0", "0"], "0", id="all-zero"),
+            pytest.param("1000000.000", ["0.001"] * 20, "999999.980", id="many-small-submeters"),
+        ],
+    )
+    def test_unmetered_value(
+        self, main_meter_value: str, submeter_values: list[str], expected: str
+    ) -> None:
+        """Test unmetered is the main meter minus the submeters, never below zero."""
         result = compute_unmetered_value(
-            main_meter_value=Decimal("500.0"),
-            submeter_values=[],
+            main_meter_value=Decimal(main_meter_value),
+            submeter_values=[Decimal(value) for value in submeter_values],
         )
-        assert result == Decimal("500.0")
+        assert result == Decimal(expected)
 
     def test_with_none_main_meter(self) -> None:
         """Test when main meter value is None."""
@@ -44,22 +55,6 @@ class TestComputeUnmeteredValue:
         )
         assert result is None
 
-    def test_negative_result_returns_zero(self) -> None:
-        """Test that negative unmetered values are clamped to zero."""
-        result = compute_unmetered_value(
-            main_meter_value=Decimal("100.0"),
-            submeter_values=[Decimal("150.0")],
-        )
-        assert result == Decimal("0")
-
-    def test_exact_match_returns_zero(self) -> None:
-        """Test when submeters exactly match main meter."""
-        result = compute_unmetered_value(
-            main_meter_value=Decimal("200.0"),
-            submeter_values=[Decimal("100.0"), Decimal("100.0")],
-        )
-        assert result == Decimal("0")
-
     def test_decimal_precision(self) -> None:
         """Test that decimal precision is maintained."""
         result = compute_unmetered_value(
@@ -86,8 +81,18 @@ class TestPropertyEndpoints:
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_property_minimal(self, client: TestClient) -> None:
-        """Test creating a property with minimal data."""
+    def test_get_property(self, client: TestClient, make_property: Callable[..., Property]) -> None:
+        """Test getting a property by ID."""
+        property_id = make_property("Get Test Property").id
+
+        # Then get it
+        response = client.get(f"/api/properties/{property_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["display_name"] == "Get Test Property"
+
+    def test_property_basic_endpoints(self, client: TestClient) -> None:
+        """Test a minimal create, the list and a missing property in one pass."""
         response = client.post(
             "/api/properties/",
             json={"display_name": "Minimal Property"},
@@ -97,40 +102,18 @@ class TestPropertyEndpoints:
         assert data["display_name"] == "Minimal Property"
         assert data["address"] is None
 
-    def test_get_property(self, client: TestClient) -> None:
-        """Test getting a property by ID."""
-        # First create a property
-        create_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Get Test Property"},
-        )
-        property_id = create_response.json()["id"]
-
-        # Then get it
-        response = client.get(f"/api/properties/{property_id}")
+        response = client.get("/api/properties/")
         assert response.status_code == 200
-        data = response.json()
-        assert data["display_name"] == "Get Test Property"
+        assert data["id"] in [prop["id"] for prop in response.json()]
 
-    def test_get_property_not_found(self, client: TestClient) -> None:
-        """Test getting a non-existent property."""
         response = client.get("/api/properties/99999")
         assert response.status_code == 404
 
-    def test_list_properties(self, client: TestClient) -> None:
-        """Test listing properties."""
-        response = client.get("/api/properties/")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-
-    def test_update_property(self, client: TestClient) -> None:
+    def test_update_property(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test updating a property."""
-        # Create a property
-        create_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Original Name"},
-        )
-        property_id = create_response.json()["id"]
+        property_id = make_property("Original Name").id
 
         # Update it
         response = client.patch(
@@ -160,14 +143,11 @@ class TestPropertyEndpoints:
 class TestMeterEndpoints:
     """Tests for meter API endpoints."""
 
-    def test_create_submeter(self, client: TestClient) -> None:
+    def test_create_submeter(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test creating a submeter."""
-        # Create a property first
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Submeter Test Property"},
-        )
-        property_id = prop_response.json()["id"]
+        property_id = make_property("Submeter Test Property").id
 
         # Create a submeter (all submeters are physical now)
         response = client.post(
@@ -185,23 +165,11 @@ class TestMeterEndpoints:
         assert data["name"] == "gg"
         assert data["location"] == "Ground floor"
 
-    def test_duplicate_submeter_name_rejected(self, client: TestClient) -> None:
+    def test_duplicate_submeter_name_rejected(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test that duplicate submeter names are rejected."""
-        # Create a property
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Duplicate Test Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create first submeter
-        client.post(
-            "/api/meters/submeter",
-            json={
-                "property_id": property_id,
-                "name": "gg",
-            },
-        )
+        property_id = make_property("Duplicate Test Property", submeters=["gg"]).id
 
         # Try to create duplicate
         response = client.post(
@@ -213,39 +181,53 @@ class TestMeterEndpoints:
         )
         assert response.status_code == 400
 
-    def test_get_meter(self, client: TestClient) -> None:
+    def test_get_meter(self, client: TestClient, make_property: Callable[..., Property]) -> None:
         """Test getting a meter by ID."""
-        # Create a property (which creates a main meter)
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Get Meter Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Get meters for property
-        meters_response = client.get(f"/api/properties/{property_id}/meters")
-        meter_id = meters_response.json()[0]["id"]
+        meter_id = make_property("Get Meter Property").meters[0].id  # the main meter
 
         # Get the meter
         response = client.get(f"/api/meters/{meter_id}")
         assert response.status_code == 200
         assert response.json()["id"] == meter_id
 
+    def test_meters_for_property_cached_per_session(
+        self, make_property: Callable[..., Property]
+    ) -> None:
+        """Test meter lookups are cached on the session and refreshed after new meters."""
+        property_id = make_property("Meter Cache Property").id
+
+        with SessionLocal() as db:
+            with count_queries(db.connection()) as queries:
+                meters = get_meters_for_property(db, property_id)
+                assert get_main_meter_for_property(db, property_id) is meters[0]
+                assert get_submeters_for_property(db, property_id) == []
+                assert get_meters_split(db, property_id) == (meters[0], [])
+            assert len(queries) == 1
+
+            create_submeter(db, SubMeterCreate(property_id=property_id, name="cached"))
+            submeters = get_submeters_for_property(db, property_id)
+            assert [m.name for m in submeters] == ["cached"]
+
+    def test_meters_for_property_raise_on_lazy_load(
+        self, make_property: Callable[..., Property]
+    ) -> None:
+        """Test meter list loads refuse implicit relationship loading."""
+        property_id = make_property("Meter Raiseload Property").id
+
+        with SessionLocal() as db:
+            (main_meter,) = get_meters_for_property(db, property_id)
+            with pytest.raises(InvalidRequestError):
+                _ = main_meter.readings
+
 
 class TestReadingEndpoints:
     """Tests for meter reading (ledger) API endpoints."""
 
-    def test_create_single_reading(self, client: TestClient) -> None:
+    def test_create_single_reading(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test creating a single meter reading."""
-        # Create property and get main meter
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Reading Test Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        meters_response = client.get(f"/api/properties/{property_id}/meters")
-        meter_id = meters_response.json()[0]["id"]
+        _, meter_id, _ = reading_property
 
         # Create a reading
         response = client.post(
@@ -261,24 +243,11 @@ class TestReadingEndpoints:
         assert data["meter_id"] == meter_id
         assert Decimal(data["value"]) == Decimal("250.5")
 
-    def test_bulk_readings(self, client: TestClient) -> None:
+    def test_bulk_readings(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test creating bulk readings for a property."""
-        # Create property with submeters
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Bulk Reading Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create submeters
-        for name in ["gg", "sg"]:
-            client.post(
-                "/api/meters/submeter",
-                json={
-                    "property_id": property_id,
-                    "name": name,
-                },
-            )
+        property_id, _, _ = reading_property
 
         # Submit bulk readings
         response = client.post(
@@ -294,24 +263,11 @@ class TestReadingEndpoints:
         readings = response.json()
         assert len(readings) == 3  # main + 2 submeters
 
-    def test_get_property_reading_summary(self, client: TestClient) -> None:
+    def test_get_property_reading_summary(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test getting a reading summary with computed unmetered."""
-        # Create property with submeters
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Summary Test Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create submeters
-        for name in ["gg", "sg"]:
-            client.post(
-                "/api/meters/submeter",
-                json={
-                    "property_id": property_id,
-                    "name": name,
-                },
-            )
+        property_id, _, _ = reading_property
 
         # Submit bulk readings
         timestamp = "2024-01-15T10:30:00Z"
@@ -336,32 +292,23 @@ class TestReadingEndpoints:
         assert Decimal(data["unmetered"]) == Decimal("230.0")  # 500 - 150 - 120
         assert len(data["submeters"]) == 2
 
-    def test_get_latest_readings(self, client: TestClient) -> None:
+    def test_get_latest_readings(
+        self,
+        client: TestClient,
+        reading_property: tuple[int, int, dict[str, int]],
+        add_readings: Callable[..., None],
+    ) -> None:
         """Test getting the latest readings for a property."""
-        # Create property
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Latest Reading Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Get meters (main meter)
-        meters_response = client.get(f"/api/properties/{property_id}/meters")
-        meter_id = meters_response.json()[0]["id"]
+        property_id, meter_id, _ = reading_property
 
         # Create readings at different times
-        for timestamp, value in [
-            ("2024-01-15T10:00:00Z", "100.0"),
-            ("2024-01-15T11:00:00Z", "200.0"),
-        ]:
-            client.post(
-                "/api/readings/",
-                json={
-                    "meter_id": meter_id,
-                    "reading_timestamp": timestamp,
-                    "value": value,
-                },
-            )
+        add_readings(
+            meter_id,
+            [
+                (datetime(2024, 1, 15, 10, tzinfo=UTC), Decimal("100.0")),
+                (datetime(2024, 1, 15, 11, tzinfo=UTC), Decimal("200.0")),
+            ],
+        )
 
         # Get latest
         response = client.get(f"/api/readings/property/{property_id}/latest")
@@ -369,29 +316,20 @@ class TestReadingEndpoints:
         data = response.json()
         assert Decimal(data["main_meter"]) == Decimal("200.0")
 
-    def test_get_meter_history(self, client: TestClient) -> None:
+    def test_get_meter_history(
+        self,
+        client: TestClient,
+        reading_property: tuple[int, int, dict[str, int]],
+        add_readings: Callable[..., None],
+    ) -> None:
         """Test getting reading history for a meter."""
-        # Create property
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "History Test Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Get main meter
-        meters_response = client.get(f"/api/properties/{property_id}/meters")
-        meter_id = meters_response.json()[0]["id"]
+        _, meter_id, _ = reading_property
 
         # Create multiple readings
-        for i in range(5):
-            client.post(
-                "/api/readings/",
-                json={
-                    "meter_id": meter_id,
-                    "reading_timestamp": f"2024-01-{15 + i}T10:00:00Z",
-                    "value": str(100 + i * 10),
-                },
-            )
+        add_readings(
+            meter_id,
+            [(datetime(2024, 1, 15 + i, 10, tzinfo=UTC), Decimal(100 + i * 10)) for i in range(5)],
+        )
 
         # Get history
         response = client.get(f"/api/readings/meter/{meter_id}/history")
@@ -405,24 +343,11 @@ class TestReadingEndpoints:
 class TestConsumptionEndpoints:
     """Tests for consumption calculation endpoints."""
 
-    def test_get_property_consumption(self, client: TestClient) -> None:
+    def test_get_property_consumption(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test calculating consumption over a period."""
-        # Create property with submeters
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Consumption Test Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create submeters
-        for name in ["apt_a", "apt_b"]:
-            client.post(
-                "/api/meters/submeter",
-                json={
-                    "property_id": property_id,
-                    "name": name,
-                },
-            )
+        property_id = make_property("Consumption Test Property", submeters=["apt_a", "apt_b"]).id
 
         # Record readings at start of month
         start_timestamp = "2024-01-01T00:00:00Z"
@@ -479,24 +404,11 @@ class TestConsumptionEndpoints:
 class TestCostDistributionEndpoints:
     """Tests for cost distribution endpoints."""
 
-    def test_distribute_costs(self, client: TestClient) -> None:
+    def test_distribute_costs(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test distributing costs across submeters."""
-        # Create property with submeters
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "Cost Distribution Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create submeters
-        for name in ["apt_a", "apt_b"]:
-            client.post(
-                "/api/meters/submeter",
-                json={
-                    "property_id": property_id,
-                    "name": name,
-                },
-            )
+        property_id = make_property("Cost Distribution Property", submeters=["apt_a", "apt_b"]).id
 
         # Record readings at start of month
         start_timestamp = "2024-01-01T00:00:00Z"
@@ -566,24 +478,11 @@ class TestCostDistributionEndpoints:
         assert Decimal(apt_b["total_consumption"]) == Decimal("300.0")
         assert Decimal(apt_b["cost"]) == Decimal("300.00")
 
-    def test_distribute_costs_no_unmetered(self, client: TestClient) -> None:
+    def test_distribute_costs_no_unmetered(
+        self, client: TestClient, make_property: Callable[..., Property]
+    ) -> None:
         """Test cost distribution when there's no unmetered consumption."""
-        # Create property with submeters
-        prop_response = client.post(
-            "/api/properties/",
-            json={"display_name": "No Unmetered Cost Property"},
-        )
-        property_id = prop_response.json()["id"]
-
-        # Create submeters
-        for name in ["apt_a", "apt_b"]:
-            client.post(
-                "/api/meters/submeter",
-                json={
-                    "property_id": property_id,
-                    "name": name,
-                },
-            )
+        property_id = make_property("No Unmetered Cost Property", submeters=["apt_a", "apt_b"]).id
 
         # Record readings where submeters exactly match main meter
         start_timestamp = "2024-01-01T00:00:00Z"
@@ -1,19 +1,31 @@
 """Tests for v2 API: readings with absolute/relative types and formula-based billing."""
 
+from collections.abc import Callable
+from datetime import UTC, datetime
 from decimal import Decimal
 
-import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.core.database import SessionLocal
 from app.models.enums import MeterType, ReadingType
-
-
-@pytest.fixture(scope="module")
-def client():
-    """Create a test client with proper lifespan handling."""
-    with TestClient(app) as c:
-        yield c
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.schemas.v2.readings import BulkReadingCreateV2
+from app.services.auth import create_user
+from app.services.meter import get_meter_with_property, get_meters_for_properties
+from app.services.property import associate_user_with_property, get_properties_for_user
+from app.services.v2.billing import evaluate_formula
+from app.services.v2.readings import (
+    compute_meter_consumption,
+    create_bulk_readings,
+    get_latest_readings_for_properties,
+    get_property_activity_counts,
+    get_property_consumption,
+    get_property_consumption_by_period,
+    get_readings_history,
+    get_recent_readings,
+)
+from tests.utils.query_counter import count_queries
 
 
 def _create_property_with_submeters(
@@ -49,14 +61,16 @@ def _create_property_with_submeters(
 class TestV2AbsoluteReadings:
     """Tests for v2 API with absolute readings (backward-compatible with v1 behavior)."""
 
-    def test_create_single_absolute_reading(self, client: TestClient) -> None:
+    def test_create_single_absolute_reading(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test creating a single absolute reading via v2 API."""
-        property_id, meter_ids = _create_property_with_submeters(client, "V2 Absolute Single", [])
+        _, main_meter_id, _ = reading_property
 
         response = client.post(
             "/api/v2/readings/",
             json={
-                "meter_id": meter_ids["_main"],
+                "meter_id": main_meter_id,
                 "reading_timestamp": "2024-01-15T10:00:00Z",
                 "value": "500.0",
                 "reading_type": "absolute",
@@ -64,15 +78,15 @@ class TestV2AbsoluteReadings:
         )
         assert response.status_code == 201
         data = response.json()
-        assert data["meter_id"] == meter_ids["_main"]
+        assert data["meter_id"] == main_meter_id
         assert Decimal(data["value"]) == Decimal("500.0")
         assert data["reading_type"] == ReadingType.ABSOLUTE
 
-    def test_create_bulk_absolute_readings(self, client: TestClient) -> None:
+    def test_create_bulk_absolute_readings(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test creating bulk absolute readings via v2 API."""
-        property_id, meter_ids = _create_property_with_submeters(
-            client, "V2 Absolute Bulk", ["apt_a", "apt_b"]
-        )
+        property_id, _, _ = reading_property
 
         response = client.post(
             "/api/v2/readings/bulk",
@@ -81,7 +95,7 @@ class TestV2AbsoluteReadings:
                 "reading_timestamp": "2024-01-15T10:00:00Z",
                 "reading_type": "absolute",
                 "main_meter_value": "1000.0",
-                "submeter_readings": {"apt_a": "300.0", "apt_b": "500.0"},
+                "submeter_readings": {"gg": "300.0", "sg": "500.0"},
             },
         )
         assert response.status_code == 201
@@ -90,11 +104,11 @@ class TestV2AbsoluteReadings:
         for r in readings:
             assert r["reading_type"] == ReadingType.ABSOLUTE
 
-    def test_absolute_consumption_calculation(self, client: TestClient) -> None:
+    def test_absolute_consumption_calculation(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test consumption calculation from absolute readings."""
-        property_id, meter_ids = _create_property_with_submeters(
-            client, "V2 Absolute Consumption", ["apt_a", "apt_b"]
-        )
+        property_id, _, _ = reading_property
 
         # Start of period
         client.post(
@@ -104,7 +118,7 @@ class TestV2AbsoluteReadings:
                 "reading_timestamp": "2024-01-01T00:00:00Z",
                 "reading_type": "absolute",
                 "main_meter_value": "1000.0",
-                "submeter_readings": {"apt_a": "300.0", "apt_b": "500.0"},
+                "submeter_readings": {"gg": "300.0", "sg": "500.0"},
             },
         )
 
@@ -116,7 +130,7 @@ class TestV2AbsoluteReadings:
                 "reading_timestamp": "2024-02-01T00:00:00Z",
                 "reading_type": "absolute",
                 "main_meter_value": "1500.0",
-                "submeter_readings": {"apt_a": "420.0", "apt_b": "680.0"},
+                "submeter_readings": {"gg": "420.0", "sg": "680.0"},
             },
         )
 
@@ -132,7 +146,7 @@ class TestV2AbsoluteReadings:
 
         # Main: 1500 - 1000 = 500
         assert Decimal(data["main_meter_consumption"]) == Decimal("500.0")
-        # apt_a: 420 - 300 = 120, apt_b: 680 - 500 = 180
+        # gg: 420 - 300 = 120, sg: 680 - 500 = 180
         assert Decimal(data["total_submetered_consumption"]) == Decimal("300.0")
         # Unmetered: 500 - 300 = 200
         assert Decimal(data["unmetered_consumption"]) == Decimal("200.0")
@@ -147,14 +161,16 @@ class TestV2AbsoluteReadings:
 class TestV2RelativeReadings:
     """Tests for v2 API with relative readings (period consumption values)."""
 
-    def test_create_single_relative_reading(self, client: TestClient) -> None:
+    def test_create_single_relative_reading(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test creating a single relative reading."""
-        property_id, meter_ids = _create_property_with_submeters(client, "V2 Relative Single", [])
+        _, main_meter_id, _ = reading_property
 
         response = client.post(
             "/api/v2/readings/",
             json={
-                "meter_id": meter_ids["_main"],
+                "meter_id": main_meter_id,
                 "reading_timestamp": "2024-02-01T00:00:00Z",
                 "value": "350.0",
                 "reading_type": "relative",
@@ -165,11 +181,11 @@ class TestV2RelativeReadings:
         assert data["reading_type"] == ReadingType.RELATIVE
         assert Decimal(data["value"]) == Decimal("350.0")
 
-    def test_relative_consumption_calculation(self, client: TestClient) -> None:
+    def test_relative_consumption_calculation(
+        self, client: TestClient, reading_property: tuple[int, int, dict[str, int]]
+    ) -> None:
         """Test consumption from relative readings is summed over the period."""
-        property_id, meter_ids = _create_property_with_submeters(
-            client, "V2 Relative Consumption", ["apt_a", "apt_b"]
-        )
+        property_id, _, _ = reading_property
 
         # Record relative readings for January (consumption for the month)
         client.post(
@@ -179,7 +195,7 @@ class TestV2RelativeReadings:
                 "reading_timestamp": "2024-02-01T00:00:00Z",
                 "reading_type": "relative",
                 "main_meter_value": "500.0",
-                "submeter_readings": {"apt_a": "120.0", "apt_b": "180.0"},
+                "submeter_readings": {"gg": "120.0", "sg": "180.0"},
             },
         )
 
@@ -198,6 +214,70 @@ class TestV2RelativeReadings:
         assert Decimal(data["total_submetered_consumption"]) == Decimal("300.0")
         assert Decimal(data["unmetered_consumption"]) == Decimal("200.0")
 
+    def test_consumption_by_period(
+        self,
+        reading_property: tuple[int, int, dict[str, int]],
+        add_readings: Callable[..., None],
+    ) -> None:
+        """Test several periods are computed together, mixing reading types per meter."""
+        property_id, main_meter_id, submeter_ids = reading_property
+
+        add_readings(
+            main_meter_id,
+            [
+                (datetime(2024, 1, 1, tzinfo=UTC), Decimal("1000.0")),
+                (datetime(2024, 2, 1, tzinfo=UTC), Decimal("1400.0")),
+                (datetime(2024, 3, 1, tzinfo=UTC), Decimal("1650.0")),
+            ],
+        )
+        add_readings(
+            submeter_ids["gg"],
+            [
+                (datetime(2024, 1, 15, tzinfo=UTC), Decimal("100.0")),
+                (datetime(2024, 2, 1, tzinfo=UTC), Decimal("50.0")),
+                (datetime(2024, 2, 20, tzinfo=UTC), Decimal("70.0")),
+            ],
+            ReadingType.RELATIVE,
+        )
+
+        periods = [
+            (datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 2, 1, tzinfo=UTC)),
+            (datetime(2024, 2, 1, tzinfo=UTC), datetime(2024, 3, 1, tzinfo=UTC)),
+        ]
+        with SessionLocal() as db:
+            january, february = get_property_consumption_by_period(db, property_id, periods)
+
+        assert january.main_meter_consumption == Decimal("400.0")
+        assert january.total_submetered_consumption == Decimal("150.0")
+        assert january.unmetered_consumption == Decimal("250.0")
+        assert february.main_meter_consumption == Decimal("250.0")
+        assert february.total_submetered_consumption == Decimal("70.0")
+        assert february.unmetered_consumption == Decimal("180.0")
+
+    def test_relative_sum_aggregated_exactly(
+        self,
+        reading_property: tuple[int, int, dict[str, int]],
+        add_readings: Callable[..., None],
+    ) -> None:
+        """Test many fractional relative readings sum to an exact Decimal in SQL."""
+        _, main_meter_id, _ = reading_property
+
+        add_readings(
+            main_meter_id,
+            [(datetime(2024, 4, day, 12, tzinfo=UTC), Decimal("0.1")) for day in range(1, 31)],
+            ReadingType.RELATIVE,
+        )
+
+        with SessionLocal() as db:
+            consumption = compute_meter_consumption(
+                db,
+                main_meter_id,
+                datetime(2024, 4, 1, tzinfo=UTC),
+                datetime(2024, 5, 1, tzinfo=UTC),
+            )
+        assert consumption == Decimal("3.000")
+        assert isinstance(consumption, Decimal)
+
 
 class TestV2ReadingSummary:
     """Tests for reading summary and history endpoints."""
@@ -251,19 +331,103 @@ class TestV2ReadingSummary:
         data = response.json()
         assert Decimal(data["main_meter"]) == Decimal("200.0")
 
-    def test_meter_history(self, client: TestClient) -> None:
+    def test_latest_readings_for_several_properties(
+        self, client: TestClient, add_readings: Callable[..., None]
+    ) -> None:
+        """Test latest readings are resolved per property from one batched lookup."""
+        first_id, first_meters = _create_property_with_submeters(
+            client, "V2 Latest Batch A", ["apt_a"]
+        )
+        second_id, second_meters = _create_property_with_submeters(client, "V2 Latest Batch B", [])
+        empty_id, _ = _create_property_with_submeters(client, "V2 Latest Batch Empty", [])
+
+        add_readings(first_meters["_main"], [(datetime(2024, 3, 1, tzinfo=UTC), Decimal("900.0"))])
+        add_readings(first_meters["apt_a"], [(datetime(2024, 3, 1, tzinfo=UTC), Decimal("400.0"))])
+        # Second property's latest timestamp differs from the first's
+        add_readings(
+            second_meters["_main"],
+            [
+                (datetime(2024, 3, 1, tzinfo=UTC), Decimal("50.0")),
+                (datetime(2024, 4, 1, tzinfo=UTC), Decimal("80.0")),
+            ],
+        )
+
+        with SessionLocal() as db:
+            meters_by_property = get_meters_for_properties(db, [first_id, second_id, empty_id])
+            latest = get_latest_readings_for_properties(db, meters_by_property)
+
+        assert latest[empty_id] is None
+        assert latest[first_id].main_meter == Decimal("900.0")
+        assert latest[first_id].unmetered == Decimal("500.0")
+        assert [s.meter_id for s in latest[first_id].submeters] == [first_meters["apt_a"]]
+        assert latest[second_id].main_meter == Decimal("80.0")
+        assert latest[second_id].submeters == []
+
+    def test_recent_readings_capped_per_meter(
+        self, client: TestClient, add_readings: Callable[..., None]
+    ) -> None:
+        """Test recent readings merge meters newest first with a per-meter cap."""
+        _, meters = _create_property_with_submeters(client, "V2 Recent", ["apt_a"])
+        add_readings(
+            meters["_main"],
+            [(datetime(2024, 7, day, tzinfo=UTC), Decimal(day * 10)) for day in range(1, 6)],
+        )
+        add_readings(meters["apt_a"], [(datetime(2024, 7, 3, 12, tzinfo=UTC), Decimal("7.0"))])
+
+        with SessionLocal() as db:
+            recent = get_recent_readings(
+                db, [meters["_main"], meters["apt_a"]], limit=3, per_meter=2
+            )
+
+        assert [(r.meter_id, r.value) for r in recent] == [
+            (meters["_main"], Decimal("50.0")),
+            (meters["_main"], Decimal("40.0")),
+            (meters["apt_a"], Decimal("7.0")),
+        ]
+
+    def test_property_activity_counts(
+        self, client: TestClient, add_readings: Callable[..., None]
+    ) -> None:
+        """Test meter and recent-reading counts are grouped per user property."""
+        busy_id, busy_meters = _create_property_with_submeters(
+            client, "V2 Activity Busy", ["apt_a", "apt_b"]
+        )
+        quiet_id, _ = _create_property_with_submeters(client, "V2 Activity Quiet", [])
+        other_id, _ = _create_property_with_submeters(client, "V2 Activity Other", [])
+
+        add_readings(
+            busy_meters["apt_a"],
+            [
+                (datetime(2024, 5, 1, tzinfo=UTC), Decimal("1")),
+                (datetime(2024, 6, 1, tzinfo=UTC), Decimal("1")),
+                (datetime(2024, 6, 10, tzinfo=UTC), Decimal("1")),
+            ],
+        )
+
+        with SessionLocal() as db:
+            user = create_user(
+                db,
+                UserCreate(
+                    username="activity_counts",
+                    email="activity_counts@example.com",
+                    password="secret123",
+                ),
+            )
+            associate_user_with_property(db, user.id, busy_id)
+            associate_user_with_property(db, user.id, quiet_id)
+            counts = get_property_activity_counts(db, user.id, datetime(2024, 6, 1, tzinfo=UTC))
+
+        assert counts == {busy_id: (3, 2), quiet_id: (1, 0)}
+        assert other_id not in counts
+
+    def test_meter_history(self, client: TestClient, add_readings: Callable[..., None]) -> None:
         """Test getting reading history for a meter."""
         property_id, meter_ids = _create_property_with_submeters(client, "V2 History Test", [])
 
-        for i in range(5):
-            client.post(
-                "/api/v2/readings/",
-                json={
-                    "meter_id": meter_ids["_main"],
-                    "reading_timestamp": f"2024-01-{10 + i}T00:00:00Z",
-                    "value": str(100 + i * 50),
-                },
-            )
+        add_readings(
+            meter_ids["_main"],
+            [(datetime(2024, 1, 10 + i, tzinfo=UTC), Decimal(100 + i * 50)) for i in range(5)],
+        )
 
         response = client.get(f"/api/v2/readings/meter/{meter_ids['_main']}/history")
         assert response.status_code == 200
@@ -271,6 +435,141 @@ class TestV2ReadingSummary:
         assert data["total"] == 5
         assert len(data["readings"]) == 5
 
+        # A partial page still reports the full total
+        response = client.get(
+            f"/api/v2/readings/meter/{meter_ids['_main']}/history",
+            params={"limit": 2, "offset": 1},
+        )
+        data = response.json()
+        assert data["total"] == 5
+        assert [Decimal(r["value"]) for r in data["readings"]] == [Decimal("250"), Decimal("200")]
+
+        # Paging past the end returns no rows but keeps the total
+        response = client.get(
+            f"/api/v2/readings/meter/{meter_ids['_main']}/history",
+            params={"offset": 10},
+        )
+        data = response.json()
+        assert data["total"] == 5
+        assert data["readings"] == []
+
+
+class TestV2QueryCounts:
+    """Statement-count guards against N+1 regressions in the reading services."""
+
+    def test_bulk_readings_single_insert(self, client: TestClient) -> None:
+        """Test a bulk reading is one meters lookup plus one INSERT."""
+        property_id, _ = _create_property_with_submeters(
+            client, "V2 Queries Bulk", ["apt_a", "apt_b", "apt_c"]
+        )
+        bulk = BulkReadingCreateV2(
+            property_id=property_id,
+            reading_timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+            main_meter_value=Decimal("100"),
+            submeter_readings={"apt_a": Decimal("1"), "apt_b": Decimal("2"), "apt_c": Decimal("3")},
+        )
+
+        with SessionLocal() as db, count_queries(db.connection()) as queries:
+            readings = create_bulk_readings(db, bulk)
+
+        assert len(readings) == 4
+        assert len(queries) == 2
+
+    def test_consumption_queries_independent_of_meters_and_periods(
+        self, client: TestClient
+    ) -> None:
+        """Test consumption for many meters and periods is one meters lookup plus one aggregate."""
+        property_id, _ = _create_property_with_submeters(
+            client, "V2 Queries Consumption", ["apt_a", "apt_b", "apt_c"]
+        )
+        periods = [
+            (datetime(2024, month, 1, tzinfo=UTC), datetime(2024, month + 1, 1, tzinfo=UTC))
+            for month in range(1, 7)
+        ]
+
+        with SessionLocal() as db:
+            with count_queries(db.connection()) as queries:
+                get_property_consumption(db, property_id, *periods[0])
+            assert len(queries) <= 2
+
+        with SessionLocal() as db:
+            with count_queries(db.connection()) as queries:
+                summaries = get_property_consumption_by_period(db, property_id, periods)
+            assert len(summaries) == 6
+            assert len(queries) <= 2
+
+    def test_latest_readings_single_query(self, client: TestClient) -> None:
+        """Test latest readings for several properties need one query once meters are loaded."""
+        property_ids = [
+            _create_property_with_submeters(client, f"V2 Queries Latest {i}", ["apt_a"])[0]
+            for i in range(3)
+        ]
+
+        with SessionLocal() as db:
+            meters_by_property = get_meters_for_properties(db, property_ids)
+            with count_queries(db.connection()) as queries:
+                get_latest_readings_for_properties(db, meters_by_property)
+            assert len(queries) == 1
+
+    def test_history_count_skipped_on_short_page(
+        self, client: TestClient, add_readings: Callable[..., None]
+    ) -> None:
+        """Test a history page shorter than the limit needs no separate count query."""
+        _, meter_ids = _create_property_with_submeters(client, "V2 Queries History", [])
+        add_readings(
+            meter_ids["_main"],
+            [(datetime(2024, 5, day, tzinfo=UTC), Decimal(day * 10)) for day in range(1, 4)],
+        )
+
+        with SessionLocal() as db:
+            with count_queries(db.connection()) as queries:
+                readings, total = get_readings_history(db, meter_ids["_main"], limit=2, offset=2)
+            assert (len(readings), total) == (1, 3)
+            assert len(queries) == 1
+
+            with count_queries(db.connection()) as queries:
+                readings, total = get_readings_history(db, meter_ids["_main"], limit=2)
+            assert (len(readings), total) == (2, 3)
+            assert len(queries) == 2
+
+    def test_properties_for_user_reused_within_session(self, client: TestClient) -> None:
+        """Test a user's properties are loaded once per session, not once per call."""
+        property_id, _ = _create_property_with_submeters(client, "V2 Queries User Props", [])
+        with SessionLocal() as db:
+            user = create_user(
+                db,
+                UserCreate(
+                    username="props_reuse",
+                    email="props_reuse@example.com",
+                    password="secret123",
+                ),
+            )
+            associate_user_with_property(db, user.id, property_id)
+            user_id = user.id
+
+        with SessionLocal() as db:
+            # Loaded and held for the request by the session-auth dependency
+            current_user = db.get(User, user_id)
+            with count_queries(db.connection()) as queries:
+                first = get_properties_for_user(db, user_id)
+                second = get_properties_for_user(db, user_id)
+            assert [prop.id for prop in first] == [prop.id for prop in second] == [property_id]
+            assert current_user.properties == first
+            assert len(queries) == 1
+
+    def test_meter_with_property_single_query(self, client: TestClient) -> None:
+        """Test a meter and its property load together in one query."""
+        property_id, meters = _create_property_with_submeters(
+            client, "V2 Queries Meter Property", ["apt_a"]
+        )
+
+        with SessionLocal() as db:
+            with count_queries(db.connection()) as queries:
+                meter, prop = get_meter_with_property(db, meters["apt_a"])
+            assert len(queries) == 1
+            assert meter.name == "apt_a"
+            assert prop.id == property_id == meter.property_id
+
 
 class TestV2CostFormulas:
     """Tests for cost formula CRUD operations."""
@@ -411,6 +710,50 @@ class TestV2CostFormulas:
         assert get_resp.json()["is_active"] is False
 
 
+class TestEvaluateFormula:
+    """Unit tests for integer-based formula evaluation."""
+
+    def test_matches_decimal_reference(self) -> None:
+        """Test that the result equals the plain Decimal computation."""
+        terms = {"gg": Decimal("1.0"), "sg": Decimal("0.4"), "_unmetered": Decimal("0.125")}
+        consumptions = {
+            "gg": Decimal("200.125"),
+            "sg": Decimal("300.5"),
+            "_unmetered": Decimal("7"),
+        }
+        total_cost = Decimal("1234.56")
+        main = Decimal("507.625")
+        weighted = sum(coeff * consumptions[name] for name, coeff in terms.items())
+        expected = (total_cost * weighted / main).quantize(Decimal("0.01"))
+        assert evaluate_formula(terms, consumptions, total_cost, main) == expected
+
+    def test_missing_meter_counts_as_zero(self) -> None:
+        """Test that terms referencing unknown meters contribute nothing."""
+        result = evaluate_formula(
+            {"gg": Decimal("1"), "gone": Decimal("2")},
+            {"gg": Decimal("50")},
+            Decimal("100"),
+            Decimal("100"),
+        )
+        assert result == Decimal("50.00")
+
+    def test_rounds_half_even(self) -> None:
+        """Test that half-cent results round to even like Decimal.quantize."""
+        assert evaluate_formula(
+            {"gg": Decimal("1")}, {"gg": Decimal("1")}, Decimal("0.125"), Decimal("1")
+        ) == Decimal("0.12")
+        assert evaluate_formula(
+            {"gg": Decimal("1")}, {"gg": Decimal("1")}, Decimal("0.135"), Decimal("1")
+        ) == Decimal("0.14")
+
+    def test_zero_main_consumption(self) -> None:
+        """Test that a non-positive main consumption yields zero cost."""
+        result = evaluate_formula(
+            {"gg": Decimal("1")}, {"gg": Decimal("10")}, Decimal("100"), Decimal("0")
+        )
+        assert result == Decimal("0")
+
+
 class TestV2CostDistribution:
     """Tests for formula-based cost distribution."""
 
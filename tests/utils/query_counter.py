@@ -0,0 +1,28 @@
+"""Count SQL statements executed on a connection, for N+1 regression tests."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+@contextmanager
+def count_queries(conn: Connection | Engine) -> Iterator[list[str]]:
+    """Collect the SQL text of every statement executed on conn inside the block.
+
+    Pass db.connection() to count a session's statements, or the engine to count
+    statements from every connection. SAVEPOINT statements are skipped: they come from
+    the per-test rollback (see conftest.py), where a commit releases a savepoint.
+    """
+    queries: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if "SAVEPOINT" not in statement:
+            queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)